@@ -1,14 +1,17 @@
 """Async subprocess runner for Claude CLI sessions with tee pattern.
 
-Each session runs `claude -p ... --output-format stream-json`, streaming
-stdout line by line. Every line is simultaneously written to the log file
-and parsed into events fed to the TUI.
+Each session runs `claude -p ... --output-format stream-json`. Stdout is
+received directly by a subprocess protocol (no StreamReader) and split on
+newlines; every raw line is simultaneously written to the log file and
+parsed (undecoded) into events fed to the TUI.
 """
 
 from __future__ import annotations
 
 import asyncio
+import os
 import signal
+from collections.abc import Callable
 from pathlib import Path
 
 from .models import (
@@ -18,11 +21,97 @@ from .models import (
     StepResult,
     StreamEvent,
 )
-from .stream_parser import parse_line
+from .stream_parser import is_ignorable, parse_line
 from .tui import TUI
 
-# Track active subprocess for signal-based cleanup
-_active_process: asyncio.subprocess.Process | None = None
+# PIDs of running claude subprocesses, for signal-based cleanup. A set, so
+# concurrent sessions are all terminated, not just the most recent one.
+_active_pids: set[int] = set()
+
+# Log tee batching: accumulate raw output and write() it to the log fd once
+# 64 KiB is pending or 16ms have passed since the last write
+_LOG_BUFFER_SIZE = 64 * 1024
+_LOG_FLUSH_INTERVAL = 0.016  # seconds
+
+# Fixed argv pieces for stream-json sessions; only turns/model vary (the
+# prompt is written to stdin)
+_CLAUDE_BASE_ARGS = ("claude", "-p")
+_CLAUDE_STREAM_ARGS = ("--verbose", "--output-format", "stream-json", "--dangerously-skip-permissions")
+
+# Seconds between SIGTERM and SIGKILL when a session exceeds its timeout
+_TERMINATE_GRACE_SECS = 10
+
+
+def _write_all(fd: int, data: bytes | bytearray) -> None:
+    """Write all of *data* to a raw file descriptor, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+class _LineBlockProtocol(asyncio.SubprocessProtocol):
+    """Receive subprocess stdout inline and hand on blocks of complete lines.
+
+    Each pipe read is cut at its last newline and passed to *on_block*
+    directly from the transport callback, so many lines are handled per
+    event-loop turn without StreamReader buffering or waiter futures. A
+    trailing partial line is carried over; at EOF any unterminated
+    remainder is delivered as-is. Errors raised by *on_block* end the
+    stream and surface through ``eof``.
+    """
+
+    def __init__(self, on_block: Callable[[bytes], None]) -> None:
+        loop = asyncio.get_running_loop()
+        self._on_block = on_block
+        self._pending = bytearray()
+        self.eof: asyncio.Future[None] = loop.create_future()
+        self.exited: asyncio.Future[None] = loop.create_future()
+
+    def pipe_data_received(self, fd: int, data: bytes) -> None:
+        if self.eof.done():
+            return
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:
+            self._pending += data
+            return
+        view = memoryview(data)
+        if self._pending:
+            self._pending += view[:cut]
+            block = bytes(self._pending)
+            self._pending.clear()
+        else:
+            # Full-length slice of bytes is the same object: no copy when the
+            # read ends on a newline, which is the common case
+            block = data[:cut]
+        self._pending += view[cut:]
+        self._deliver(block)
+
+    def pipe_connection_lost(self, fd: int, exc: Exception | None) -> None:
+        if fd == 1:  # stdout (stderr is merged into it); ignore the stdin pipe
+            self.close_stream()
+
+    def process_exited(self) -> None:
+        if not self.exited.done():
+            self.exited.set_result(None)
+
+    def close_stream(self) -> None:
+        """Deliver any unterminated tail and stop accepting data."""
+        if self.eof.done():
+            return
+        if self._pending:
+            block = bytes(self._pending)
+            self._pending.clear()
+            self._deliver(block)
+        if not self.eof.done():
+            self.eof.set_result(None)
+
+    def _deliver(self, block: bytes) -> None:
+        try:
+            self._on_block(block)
+        except Exception as exc:
+            if not self.eof.done():
+                self.eof.set_exception(exc)
 
 
 async def run_claude_session(
@@ -39,80 +128,114 @@ async def run_claude_session(
 ) -> StepResult:
     """Run a Claude CLI session with stream-json output.
 
-    Tees every line to both the log file and the TUI parser.
+    Tees every line to both the log file and the TUI parser. Parsed events
+    are queued on the TUI and applied once per refresh frame; the queue is
+    drained before returning.
     Returns a StepResult with collected markers and result data.
-    """
-    global _active_process
 
-    prompt_content = prompt_file.read_text()
+    Every call spawns a fresh ``claude`` process on purpose: CS, DS and CR
+    must not share conversation context, and each needs its own turn budget
+    and log. A long-lived ``--input-format stream-json`` worker would save
+    CLI startup but would carry context across steps.
+    """
+    # The prompt goes to claude's stdin rather than argv: no exec argv copy
+    # or ARG_MAX ceiling for large prompts
+    prompt_bytes = prompt_file.read_bytes()
     if extra_prompt:
-        prompt_content = f"{prompt_content}\n\n{extra_prompt}"
-
-    cmd = [
-        "claude",
-        "-p", prompt_content,
-        "--verbose",
-        "--max-turns", str(max_turns),
-        "--output-format", "stream-json",
-        "--dangerously-skip-permissions",
-    ]
+        prompt_bytes += b"\n\n" + extra_prompt.encode("utf-8")
+
+    cmd = [*_CLAUDE_BASE_ARGS, "--max-turns", str(max_turns), *_CLAUDE_STREAM_ARGS]
     if model:
-        cmd.extend(["--model", model])
+        cmd += ("--model", model)
 
     markers: list[MarkerEvent] = []
     result_event: ResultEvent | None = None
+    loop = asyncio.get_running_loop()
 
-    proc = await asyncio.create_subprocess_exec(
-        *cmd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.STDOUT,
-        cwd=project_dir,
-        limit=10 * 1024 * 1024,  # 10 MB – stream-json lines can be very long
-    )
-    _active_process = proc
-    tui.activity_log.set_session_active(True)
-
-    timed_out = False
+    log_fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    log_pending = bytearray()
+    flush_handle: asyncio.TimerHandle | None = None
     try:
-        async def _stream_and_collect() -> int:
-            with open(log_file, "w", buffering=1) as log_fh:  # line-buffered
-                if proc.stdout is None:
-                    raise RuntimeError("Failed to capture subprocess stdout")
-                async for raw_line in proc.stdout:
-                    line = raw_line.decode("utf-8", errors="replace")
-                    log_fh.write(line)
-
-                    events = parse_line(line)
-                    for event in events:
-                        tui.handle_event(event)
-                        if isinstance(event, MarkerEvent):
-                            markers.append(event)
-                        elif isinstance(event, ResultEvent):
-                            nonlocal result_event
-                            result_event = event
-
-            return await proc.wait()
-
-        timeout_secs = timeout_minutes * 60
+        def _flush_log() -> None:
+            nonlocal flush_handle
+            if flush_handle is not None:
+                flush_handle.cancel()
+                flush_handle = None
+            _write_all(log_fd, log_pending)
+            log_pending.clear()
+
+        def _on_block(block: bytes) -> None:
+            nonlocal flush_handle, result_event
+            log_pending.extend(block)
+            if len(log_pending) >= _LOG_BUFFER_SIZE:
+                _flush_log()
+            elif flush_handle is None:
+                # Bound the log's lag behind the session even if claude then
+                # goes quiet for a long tool call
+                flush_handle = loop.call_later(_LOG_FLUSH_INTERVAL, _flush_log)
+
+            for raw_line in block.split(b"\n"):
+                if not raw_line or is_ignorable(raw_line):
+                    continue
+                events = parse_line(raw_line, show_thinking=tui.show_thinking)
+                for event in events:
+                    tui.queue_event(event)
+                    if isinstance(event, MarkerEvent):
+                        markers.append(event)
+                    elif isinstance(event, ResultEvent):
+                        result_event = event
+
+        transport, protocol = await loop.subprocess_exec(
+            lambda: _LineBlockProtocol(_on_block),
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=project_dir,
+        )
+        pid = transport.get_pid()
+        _active_pids.add(pid)
+        stdin_pipe = transport.get_pipe_transport(0)
+        stdin_pipe.write(prompt_bytes)
+        stdin_pipe.close()  # flushes, then signals EOF so claude starts
+        tui.activity_log.set_session_active(True)
+
+        timed_out = False
         try:
-            exit_code = await asyncio.wait_for(_stream_and_collect(), timeout=timeout_secs)
-        except asyncio.TimeoutError:
-            timed_out = True
-            from .models import TextEvent as _TE
-            tui.handle_event(_TE(
-                text=f"SESSION TIMEOUT: {timeout_minutes}m exceeded. Terminating subprocess.",
-                is_thinking=False,
-            ))
-            proc.terminate()
+            def _force_kill() -> None:
+                if transport.get_returncode() is None:
+                    transport.kill()
+                # Grandchildren may still hold the pipe open; end the stream anyway
+                protocol.close_stream()
+
+            def _on_timeout() -> None:
+                nonlocal timed_out, kill_handle
+                timed_out = True
+                tui.emit_text(f"SESSION TIMEOUT: {timeout_minutes}m exceeded. Terminating subprocess.")
+                transport.terminate()
+                kill_handle = loop.call_later(_TERMINATE_GRACE_SECS, _force_kill)
+
+            kill_handle: asyncio.TimerHandle | None = None
+            timeout_handle = loop.call_later(timeout_minutes * 60, _on_timeout)
             try:
-                await asyncio.wait_for(proc.wait(), timeout=10)
-            except asyncio.TimeoutError:
-                proc.kill()
-                await proc.wait()
-            exit_code = -1
+                await protocol.eof
+                await protocol.exited
+            finally:
+                timeout_handle.cancel()
+                if kill_handle is not None:
+                    kill_handle.cancel()
+            exit_code = -1 if timed_out else transport.get_returncode()
+        finally:
+            _active_pids.discard(pid)
+            transport.close()
+            tui.drain_pending()
+            tui.activity_log.set_session_active(False)
     finally:
-        _active_process = None
-        tui.activity_log.set_session_active(False)
+        if flush_handle is not None:
+            flush_handle.cancel()
+        if log_pending:
+            _write_all(log_fd, log_pending)
+        os.close(log_fd)
 
     if timed_out:
         return StepResult(
@@ -169,7 +292,8 @@ Rules:
 Read the story file at {story_file} and run 'git diff --cached --stat' to understand what changed.
 Output ONLY the commit message, nothing else."""
 
-    # git add -A
+    # git add -A — a separate step, not `commit -a`: dev-story creates new
+    # (untracked) files, and the prompt above inspects the staged diff
     add_proc = await asyncio.create_subprocess_exec(
         "git", "add", "-A",
         cwd=project_dir,
@@ -181,14 +305,19 @@ Output ONLY the commit message, nothing else."""
     tui.activity_log.set_session_active(True)
     try:
         gen_proc = await asyncio.create_subprocess_exec(
-            "claude", "-p", prompt,
+            "claude", "-p",
             "--max-turns", "5",
             "--dangerously-skip-permissions",
+            stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             cwd=project_dir,
         )
-        stdout, _ = await gen_proc.communicate()
+        _active_pids.add(gen_proc.pid)
+        try:
+            stdout, _ = await gen_proc.communicate(prompt.encode("utf-8"))
+        finally:
+            _active_pids.discard(gen_proc.pid)
         if gen_proc.returncode == 0 and stdout:
             commit_msg = stdout.decode("utf-8", errors="replace").strip()
     except (OSError, FileNotFoundError):
@@ -208,11 +337,7 @@ Output ONLY the commit message, nothing else."""
     await commit_proc.wait()
 
     success = commit_proc.returncode == 0
-    from .models import TextEvent
-    tui.handle_event(TextEvent(
-        text=f"{'Committed' if success else 'Commit failed'}: story-{story_id}",
-        is_thinking=False,
-    ))
+    tui.emit_text(f"{'Committed' if success else 'Commit failed'}: story-{story_id}")
 
     return StepResult(
         kind=StepKind.COMMIT,
@@ -222,6 +347,9 @@ Output ONLY the commit message, nothing else."""
 
 
 def cleanup_subprocess() -> None:
-    """Terminate active subprocess on signal. Called from signal handler."""
-    if _active_process is not None and _active_process.returncode is None:
-        _active_process.terminate()
+    """Terminate all active subprocesses on signal. Called from signal handler."""
+    for pid in tuple(_active_pids):
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass  # already exited
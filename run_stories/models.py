@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -28,10 +29,14 @@ class MarkerType(Enum):
     NO_READY_STORIES = "NO_READY_STORIES"
 
 
-# --- Stream event dataclasses (frozen/immutable) ---
+# Tag → MarkerType, so marker detection avoids EnumMeta.__call__ per match
+MARKER_TYPES_BY_TAG: dict[str, MarkerType] = {m.value: m for m in MarkerType}
 
 
-@dataclass(frozen=True)
+# --- Stream event dataclasses (frozen/immutable, slotted) ---
+
+
+@dataclass(frozen=True, slots=True)
 class InitEvent:
     model: str
     tools: list[str]
@@ -39,25 +44,25 @@ class InitEvent:
     session_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolUseEvent:
     tool_name: str
     input_summary: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolResultEvent:
     tool_use_id: str
     content_summary: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextEvent:
     text: str
     is_thinking: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResultEvent:
     duration_ms: int
     num_turns: int
@@ -66,25 +71,25 @@ class ResultEvent:
     cost_usd: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RateLimitEvent:
     status: str
     resets_at: datetime | None
     rate_limit_type: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemEvent:
     subtype: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarkerEvent:
     marker_type: MarkerType
     payload: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnknownEvent:
     raw_data: dict | str
 
@@ -105,7 +110,7 @@ StreamEvent = (
 # --- Orchestration state dataclasses ---
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     kind: StepKind
     story_key: str
@@ -116,7 +121,7 @@ class StepResult:
     success: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class StoryState:
     story_key: str
     story_id: str
@@ -126,7 +131,7 @@ class StoryState:
     started_at: datetime = field(default_factory=lambda: datetime.now(tz=timezone.utc))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SessionConfig:
     project_dir: Path
     max_stories: int = 999
@@ -145,7 +150,7 @@ class SessionConfig:
 
 # --- Helpers ---
 
-# Regex for extracting tool input summaries
+# Primary input field shown for each known tool
 _TOOL_INPUT_KEYS = {
     "Read": "file_path",
     "Edit": "file_path",
@@ -158,13 +163,30 @@ _TOOL_INPUT_KEYS = {
 }
 
 
-def summarize_tool_input(tool_name: str, input_data: dict) -> str:
-    """Extract a short summary from tool input data."""
-    key = _TOOL_INPUT_KEYS.get(tool_name)
-    if key and key in input_data:
-        return str(input_data[key])
-    # Fallback: first string value
+def _first_string_value(input_data: dict) -> str:
+    """Fallback summary: the first string value in the input, if any."""
     for v in input_data.values():
         if isinstance(v, str):
             return v
     return ""
+
+
+def _make_key_summarizer(key: str) -> Callable[[dict], str]:
+    def _summarize(input_data: dict) -> str:
+        if key in input_data:
+            value = input_data[key]
+            return value if isinstance(value, str) else str(value)
+        return _first_string_value(input_data)
+
+    return _summarize
+
+
+# Per-tool summarizers, built once so each call is a single dict lookup
+_TOOL_SUMMARIZERS: dict[str, Callable[[dict], str]] = {
+    name: _make_key_summarizer(key) for name, key in _TOOL_INPUT_KEYS.items()
+}
+
+
+def summarize_tool_input(tool_name: str, input_data: dict) -> str:
+    """Extract a short summary from tool input data."""
+    return _TOOL_SUMMARIZERS.get(tool_name, _first_string_value)(input_data)
@@ -7,6 +7,8 @@ asyncio + the stream parser + TUI instead of bare shell.
 from __future__ import annotations
 
 import asyncio
+import os
+import re
 import shutil
 import time
 from datetime import datetime
@@ -18,20 +20,34 @@ from .models import (
     SessionConfig,
     StepKind,
     StoryState,
-    TextEvent,
 )
 from .sprint_status import (
-    count_epics,
-    count_stories,
+    cached_dev_status,
     find_done_stories,
     get_story_status,
-    load_status,
+    load_dev_status,
     next_actionable_story,
+    sprint_counts,
     story_id_from_key,
 )
 from .tui import TUI
 
 _STATUS_RETRY_DELAY = 0.5  # seconds
+_COMMIT_STORY_ID_RE = re.compile(r"story-(\d+\.\d+)")
+
+
+async def _load_status(path: Path) -> dict:
+    """Load sprint status without blocking the event loop.
+
+    Only the development_status section is parsed — it is all the query
+    helpers read. A cache hit is returned inline; a changed file is parsed
+    in a worker thread so TUI refreshes and subprocess I/O keep running
+    meanwhile.
+    """
+    dev_status = cached_dev_status(path)
+    if dev_status is None:
+        dev_status = await asyncio.to_thread(load_dev_status, path)
+    return {"development_status": dev_status}
 
 
 async def _load_status_safe(path: Path) -> dict:
@@ -41,49 +57,82 @@ async def _load_status_safe(path: Path) -> dict:
     mid-write), waits briefly and retries. The final attempt raises on failure.
     """
     try:
-        return load_status(path)
+        return await _load_status(path)
     except Exception:
         await asyncio.sleep(_STATUS_RETRY_DELAY)
-        return load_status(path)
+        return await _load_status(path)
+
+
+async def _git_output(project_dir: Path, *args: str) -> bytes:
+    """Run ``git <args>`` in *project_dir* and return its stdout.
+
+    Raises OSError if git cannot be started. (CPython spawns via vfork on
+    Linux, so there is no fork page-table copy to avoid here.)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        cwd=project_dir,
+    )
+    stdout, _ = await proc.communicate()
+    return stdout
 
 
 async def _check_git_dirty(project_dir: Path, tui: TUI) -> bool:
-    """Return True if the working tree has uncommitted changes."""
+    """Return True if the working tree has uncommitted changes.
+
+    Untracked files count (dev-story creates new files), so this stays on
+    `git status` rather than `git diff-index`; rename detection is skipped
+    since only the presence of output matters.
+    """
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "git", "status", "--porcelain",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=project_dir,
-        )
-        stdout, _ = await proc.communicate()
-        return bool(stdout and stdout.strip())
+        stdout = await _git_output(project_dir, "status", "--porcelain", "--no-renames", "--untracked-files=normal")
+        return bool(stdout.strip())
     except (OSError, FileNotFoundError):
-        tui.handle_event(TextEvent(
-            text="WARNING: Could not check git status",
-            is_thinking=False,
-        ))
+        tui.emit_text("WARNING: Could not check git status")
         return False
 
 
+async def _committed_story_ids(project_dir: Path) -> set[str]:
+    """Return every story ID (e.g. '1.2') referenced as 'story-<id>' in a commit message.
+
+    One `git log --all --format=%B` pass over full messages (subject and
+    body, like `--grep`) replaces a `--grep` search per story. Returns an
+    empty set if git is unavailable or fails.
+    """
+    try:
+        stdout = await _git_output(project_dir, "log", "--all", "--format=%B")
+    except (OSError, FileNotFoundError):
+        return set()
+    return set(_COMMIT_STORY_ID_RE.findall(stdout.decode("utf-8", errors="replace")))
+
+
 async def _check_story_committed(project_dir: Path, story_key: str) -> bool:
     """Return True if a commit referencing this story exists in git log.
 
     Searches for the story-ID pattern (e.g. 'story-1.2') used in commit
-    subjects, since the full story_key may not appear in the message.
+    messages, since the full story_key may not appear in the message.
     """
-    search_term = f"story-{story_id_from_key(story_key)}"
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            "git", "log", "--all", "--oneline", f"--grep={search_term}",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=project_dir,
-        )
-        stdout, _ = await proc.communicate()
-        return bool(stdout and stdout.strip())
-    except (OSError, FileNotFoundError):
-        return False
+    return story_id_from_key(story_key) in await _committed_story_ids(project_dir)
+
+
+async def _first_uncommitted_story(project_dir: Path, done_keys: list[str], tui: TUI) -> str | None:
+    """Return the first done story with no matching commit, if the tree is dirty.
+
+    The git-dirty check and the single commit-message scan run concurrently.
+    Returns None when the working tree is clean.
+    """
+    dirty, committed_ids = await asyncio.gather(
+        _check_git_dirty(project_dir, tui),
+        _committed_story_ids(project_dir),
+    )
+    if not dirty:
+        return None
+    for dk in done_keys:
+        if story_id_from_key(dk) not in committed_ids:
+            return dk
+    return None
 
 
 async def _run_test_gate(test_cmd: str, project_dir: Path, tui: TUI) -> bool:
@@ -94,10 +143,7 @@ async def _run_test_gate(test_cmd: str, project_dir: Path, tui: TUI) -> bool:
     if not test_cmd:
         return True
 
-    tui.handle_event(TextEvent(
-        text=f"Running test gate: {test_cmd}",
-        is_thinking=False,
-    ))
+    tui.emit_text(f"Running test gate: {test_cmd}")
     try:
         proc = await asyncio.create_subprocess_shell(
             test_cmd,
@@ -111,21 +157,12 @@ async def _run_test_gate(test_cmd: str, project_dir: Path, tui: TUI) -> bool:
             # Show last 20 lines of test output for diagnostics
             output_lines = (stdout or b"").decode("utf-8", errors="replace").strip().splitlines()
             tail = output_lines[-20:] if len(output_lines) > 20 else output_lines
-            tui.handle_event(TextEvent(
-                text=f"TEST GATE FAILED (exit {proc.returncode}):\n" + "\n".join(tail),
-                is_thinking=False,
-            ))
+            tui.emit_text(f"TEST GATE FAILED (exit {proc.returncode}):\n" + "\n".join(tail))
         else:
-            tui.handle_event(TextEvent(
-                text="Test gate passed.",
-                is_thinking=False,
-            ))
+            tui.emit_text("Test gate passed.")
         return passed
     except (OSError, FileNotFoundError) as exc:
-        tui.handle_event(TextEvent(
-            text=f"WARNING: Test gate command failed to execute: {exc}",
-            is_thinking=False,
-        ))
+        tui.emit_text(f"WARNING: Test gate command failed to execute: {exc}")
         return False
 
 
@@ -144,13 +181,18 @@ async def run_stories(config: SessionConfig, tui: TUI) -> int:
 
     # --- Preflight checks ---
     if not shutil.which("claude"):
-        tui.handle_event(TextEvent(text="ERROR: 'claude' command not found.", is_thinking=False))
+        tui.emit_text("ERROR: 'claude' command not found.")
         return 0
 
-    for f in [prompt_cs, prompt_ds, prompt_cr, sprint_status_path]:
-        if not f.exists():
-            tui.handle_event(TextEvent(text=f"ERROR: Required file not found: {f}", is_thinking=False))
-            return 0
+    # The prompts all live in pkg_dir: one directory read instead of a stat each
+    with os.scandir(pkg_dir) as entries:
+        pkg_names = {entry.name for entry in entries}
+    missing = [f for f in (prompt_cs, prompt_ds, prompt_cr) if f.name not in pkg_names]
+    if not missing and not sprint_status_path.exists():
+        missing.append(sprint_status_path)
+    if missing:
+        tui.emit_text(f"ERROR: Required file not found: {missing[0]}")
+        return 0
 
     log_dir.mkdir(parents=True, exist_ok=True)
 
@@ -158,40 +200,32 @@ async def run_stories(config: SessionConfig, tui: TUI) -> int:
     total_start = time.monotonic()
 
     # Initial sprint stats
-    _refresh_sprint_stats(sprint_status_path, tui)
+    await _refresh_sprint_stats(sprint_status_path, tui)
 
     # --- Pre-loop: commit-gap recovery for done-but-uncommitted stories ---
-    status_data = load_status(sprint_status_path)
+    status_data = await _load_status(sprint_status_path)
     done_keys = find_done_stories(status_data)
-    if done_keys and await _check_git_dirty(project_dir, tui):
-        for dk in done_keys:
-            if not await _check_story_committed(project_dir, dk):
-                dk_id = story_id_from_key(dk)
-                dk_file = impl_dir / f"{dk}.md"
-                tui.handle_event(TextEvent(
-                    text=f"Recovering uncommitted story: {dk}",
-                    is_thinking=False,
-                ))
-                await run_commit_session(
-                    story_id=dk_id,
-                    story_key=dk,
-                    story_file=dk_file,
-                    project_dir=project_dir,
-                    tui=tui,
-                )
-                _refresh_sprint_stats(sprint_status_path, tui)
-                break  # one recovery per restart
+    dk = await _first_uncommitted_story(project_dir, done_keys, tui) if done_keys else None
+    if dk is not None:  # one recovery per restart
+        dk_id = story_id_from_key(dk)
+        dk_file = impl_dir / f"{dk}.md"
+        tui.emit_text(f"Recovering uncommitted story: {dk}")
+        await run_commit_session(
+            story_id=dk_id,
+            story_key=dk,
+            story_file=dk_file,
+            project_dir=project_dir,
+            tui=tui,
+        )
+        await _refresh_sprint_stats(sprint_status_path, tui)
 
     for i in range(1, config.max_stories + 1):
         # --- Find next story ---
-        status_data = load_status(sprint_status_path)
+        status_data = await _load_status(sprint_status_path)
         result = next_actionable_story(status_data)
 
         if result is None:
-            tui.handle_event(TextEvent(
-                text="No more actionable stories. All stories have been created or completed.",
-                is_thinking=False,
-            ))
+            tui.emit_text("No more actionable stories. All stories have been created or completed.")
             break
 
         story_key, story_status = result
@@ -208,13 +242,13 @@ async def run_stories(config: SessionConfig, tui: TUI) -> int:
         story_id = story_id_from_key(story_key)
         story_file = impl_dir / f"{story_key}.md"
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        # Per-story constants reused by every step/round below
+        log_prefix = f"{timestamp}_{story_key}"
+        story_path_prompt = f"STORY_PATH: {story_file}"
 
         # Story file existence guard for DS/CR resume
         if resume_step in (StepKind.DS, StepKind.CR) and not story_file.exists():
-            tui.handle_event(TextEvent(
-                text=f"WARNING: Story file missing for {story_key}, falling back to Create Story",
-                is_thinking=False,
-            ))
+            tui.emit_text(f"WARNING: Story file missing for {story_key}, falling back to Create Story")
             resume_step = StepKind.CS
 
         story_state = StoryState(
@@ -231,36 +265,24 @@ async def run_stories(config: SessionConfig, tui: TUI) -> int:
             total_cost=tui.dashboard.total_cost,
         )
 
-        tui.handle_event(TextEvent(
-            text=f"Story {i}: {story_key} ({story_id})",
-            is_thinking=False,
-        ))
+        tui.emit_text(f"Story {i}: {story_key} ({story_id})")
 
         if config.dry_run:
-            tui.handle_event(TextEvent(
-                text=f"[DRY RUN] Would resume: {story_key} at step {resume_step.value}",
-                is_thinking=False,
-            ))
+            tui.emit_text(f"[DRY RUN] Would resume: {story_key} at step {resume_step.value}")
             story_count += 1
             continue
 
         if resume_step != StepKind.CS:
-            tui.handle_event(TextEvent(
-                text=f"RESUMING story {story_key} at {resume_step.value}",
-                is_thinking=False,
-            ))
+            tui.emit_text(f"RESUMING story {story_key} at {resume_step.value}")
 
         story_start = time.monotonic()
 
         # ---- STEP 1: CREATE STORY (CS) — skipped if resuming ----
         if resume_step == StepKind.CS:
-            story_state.current_step = StepKind.CS
-            tui.dashboard.step_cost = None
-            step_start = time.monotonic()
-            tui.dashboard.set_timer_anchors(step_start, story_start, total_start)
+            tui.dashboard.begin_step(StepKind.CS, story_start, total_start)
 
-            tui.handle_event(TextEvent(text=f"--- Step 1: Create Story ({story_key}) ---", is_thinking=False))
-            log_cs = log_dir / f"{timestamp}_{story_key}_1-create-story.log"
+            tui.emit_text(f"--- Step 1: Create Story ({story_key}) ---")
+            log_cs = log_dir / f"{log_prefix}_1-create-story.log"
 
             cs_result = await run_claude_session(
                 prompt_file=prompt_cs,
@@ -282,18 +304,14 @@ async def run_stories(config: SessionConfig, tui: TUI) -> int:
             status_data = await _load_status_safe(sprint_status_path)
             status = get_story_status(status_data, story_key)
             if status != "ready-for-dev":
-                tui.handle_event(TextEvent(
-                    text=f"ERROR: Create Story failed (status: {status}). Check log: {log_cs}",
-                    is_thinking=False,
-                ))
+                tui.emit_text(f"ERROR: Create Story failed (status: {status}). Check log: {log_cs}")
                 break
 
             if not cs_result.success:
-                tui.handle_event(TextEvent(
-                    text=f"WARNING: CS session ended with error but story {story_key} was created. Continuing. Log: {log_cs}",
-                    is_thinking=False,
-                ))
-            _refresh_sprint_stats(sprint_status_path, tui)
+                tui.emit_text(
+                    f"WARNING: CS session ended with error but story {story_key} was created. Continuing. Log: {log_cs}",
+                )
+            await _refresh_sprint_stats(sprint_status_path, tui)
 
         # ---- STEP 2-3: DEV STORY + CODE REVIEW LOOP ----
         story_done = False
@@ -305,22 +323,14 @@ async def run_stories(config: SessionConfig, tui: TUI) -> int:
         # Partial-work warning when resuming at DS
         if resume_step == StepKind.DS:
             try:
-                diff_proc = await asyncio.create_subprocess_exec(
-                    "git", "diff", "--stat",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=project_dir,
-                )
-                diff_out, _ = await diff_proc.communicate()
-                if diff_out and diff_out.strip():
-                    tui.handle_event(TextEvent(
-                        text="WARNING: Partial changes detected in working tree. Resuming DS in 10s... (press q to abort)",
-                        is_thinking=False,
-                    ))
-                    for sec in range(10, 0, -1):
-                        tui.dashboard.countdown_message = f"Resuming in {sec}s..."
-                        await asyncio.sleep(1)
-                    tui.dashboard.countdown_message = None
+                diff_out = await _git_output(project_dir, "diff", "--stat")
+                if diff_out.strip():
+                    tui.emit_text(
+                        "WARNING: Partial changes detected in working tree. Resuming DS in 10s... (press q to abort)",
+                    )
+                    tui.dashboard.start_countdown(10, "Resuming in {}s...")
+                    await asyncio.sleep(10)
+                    tui.dashboard.clear_countdown()
             except (OSError, FileNotFoundError):
                 pass
 
@@ -331,21 +341,15 @@ async def run_stories(config: SessionConfig, tui: TUI) -> int:
             if skip_first_ds and round_num == start_round:
                 pass  # jump straight to CR
             else:
-                story_state.current_step = StepKind.DS
-                tui.dashboard.step_cost = None
-                step_start = time.monotonic()
-                tui.dashboard.set_timer_anchors(step_start, story_start, total_start)
+                tui.dashboard.begin_step(StepKind.DS, story_start, total_start)
 
-                tui.handle_event(TextEvent(
-                    text=f"--- Step 2: Dev Story ({story_key}) [round {round_num}/{config.max_review_rounds}] ---",
-                    is_thinking=False,
-                ))
-                log_ds = log_dir / f"{timestamp}_{story_key}_2-dev-story-r{round_num}.log"
+                tui.emit_text(f"--- Step 2: Dev Story ({story_key}) [round {round_num}/{config.max_review_rounds}] ---")
+                log_ds = log_dir / f"{log_prefix}_2-dev-story-r{round_num}.log"
 
                 # Always pass STORY_PATH when resuming (not just round > 1)
                 extra = None
                 if round_num > 1 or resume_step in (StepKind.DS, StepKind.CR):
-                    extra = f"STORY_PATH: {story_file}"
+                    extra = story_path_prompt
 
                 ds_result = await run_claude_session(
                     prompt_file=prompt_ds,
@@ -363,7 +367,7 @@ async def run_stories(config: SessionConfig, tui: TUI) -> int:
 
                 # Check for HALT (always fatal, regardless of status)
                 if any(m.marker_type == MarkerType.HALT for m in ds_result.markers_detected):
-                    tui.handle_event(TextEvent(text=f"Dev Story HALTed. Check log: {log_ds}", is_thinking=False))
+                    tui.emit_text(f"Dev Story HALTed. Check log: {log_ds}")
                     story_done = False
                     break
 
@@ -374,63 +378,47 @@ async def run_stories(config: SessionConfig, tui: TUI) -> int:
                 status = get_story_status(status_data, story_key)
                 if status in ("review", "done"):
                     if status == "done":
-                        tui.handle_event(TextEvent(
-                            text=f"WARNING: Story {story_key} jumped to 'done' after DS. Forcing code review anyway.",
-                            is_thinking=False,
-                        ))
+                        tui.emit_text(
+                            f"WARNING: Story {story_key} jumped to 'done' after DS. Forcing code review anyway.",
+                        )
                     if not ds_result.success:
-                        tui.handle_event(TextEvent(
-                            text=f"WARNING: DS session ended with error but story {story_key} progressed to {status}. Continuing. Log: {log_ds}",
-                            is_thinking=False,
-                        ))
+                        tui.emit_text(
+                            f"WARNING: DS session ended with error but story {story_key} progressed to {status}. Continuing. Log: {log_ds}",
+                        )
                 elif not ds_result.success:
-                    tui.handle_event(TextEvent(text=f"ERROR: Dev Story failed (status: {status}). Check log: {log_ds}", is_thinking=False))
+                    tui.emit_text(f"ERROR: Dev Story failed (status: {status}). Check log: {log_ds}")
                     break
                 else:
-                    tui.handle_event(TextEvent(
-                        text=f"ERROR: Unexpected status '{status}' after dev-story for {story_key}. Check log: {log_ds}",
-                        is_thinking=False,
-                    ))
+                    tui.emit_text(
+                        f"ERROR: Unexpected status '{status}' after dev-story for {story_key}. Check log: {log_ds}",
+                    )
                     break
 
             # --- Test gate: verify tests pass before CR ---
             if not (skip_first_ds and round_num == start_round):
                 if not await _run_test_gate(config.test_cmd, project_dir, tui):
-                    tui.handle_event(TextEvent(
-                        text=f"Test gate failed after DS for {story_key}. Skipping CR, treating as rejection.",
-                        is_thinking=False,
-                    ))
+                    tui.emit_text(f"Test gate failed after DS for {story_key}. Skipping CR, treating as rejection.")
                     if round_num < config.max_review_rounds:
-                        tui.handle_event(TextEvent(
-                            text=f"Running dev-story again (round {round_num + 1}) to fix test failures...",
-                            is_thinking=False,
-                        ))
+                        tui.emit_text(f"Running dev-story again (round {round_num + 1}) to fix test failures...")
                         continue
                     else:
-                        tui.handle_event(TextEvent(
-                            text=f"WARNING: Max review rounds ({config.max_review_rounds}) reached with failing tests.",
-                            is_thinking=False,
-                        ))
+                        tui.emit_text(
+                            f"WARNING: Max review rounds ({config.max_review_rounds}) reached with failing tests.",
+                        )
                         break
 
             # --- Code Review (CR) ---
-            story_state.current_step = StepKind.CR
-            tui.dashboard.step_cost = None
-            step_start = time.monotonic()
-            tui.dashboard.set_timer_anchors(step_start, story_start, total_start)
+            tui.dashboard.begin_step(StepKind.CR, story_start, total_start)
 
-            tui.handle_event(TextEvent(
-                text=f"--- Step 3: Code Review ({story_key}) [round {round_num}/{config.max_review_rounds}] ---",
-                is_thinking=False,
-            ))
-            log_cr = log_dir / f"{timestamp}_{story_key}_3-code-review-r{round_num}.log"
+            tui.emit_text(f"--- Step 3: Code Review ({story_key}) [round {round_num}/{config.max_review_rounds}] ---")
+            log_cr = log_dir / f"{log_prefix}_3-code-review-r{round_num}.log"
 
             cr_result = await run_claude_session(
                 prompt_file=prompt_cr,
                 log_file=log_cr,
                 max_turns=config.max_turns_cr,
                 model=config.review_model,
-                extra_prompt=f"STORY_PATH: {story_file}",
+                extra_prompt=story_path_prompt,
                 tui=tui,
                 project_dir=project_dir,
                 step_kind=StepKind.CR,
@@ -448,33 +436,22 @@ async def run_stories(config: SessionConfig, tui: TUI) -> int:
                 break
 
             if not cr_result.success:
-                tui.handle_event(TextEvent(
-                    text=f"WARNING: CR session ended with error for {story_key} (status: {status}). Check log: {log_cr}",
-                    is_thinking=False,
-                ))
+                tui.emit_text(
+                    f"WARNING: CR session ended with error for {story_key} (status: {status}). Check log: {log_cr}",
+                )
 
             if round_num < config.max_review_rounds:
-                tui.handle_event(TextEvent(
-                    text=f"Code review found issues. Running dev-story again (round {round_num + 1})...",
-                    is_thinking=False,
-                ))
+                tui.emit_text(f"Code review found issues. Running dev-story again (round {round_num + 1})...")
             else:
-                tui.handle_event(TextEvent(
-                    text=f"WARNING: Max review rounds ({config.max_review_rounds}) reached. Story not fully approved.",
-                    is_thinking=False,
-                ))
+                tui.emit_text(
+                    f"WARNING: Max review rounds ({config.max_review_rounds}) reached. Story not fully approved.",
+                )
 
         # ---- STEP 4: COMMIT ----
         if story_done:
-            story_state.current_step = StepKind.COMMIT
-            tui.dashboard.step_cost = None
-            step_start = time.monotonic()
-            tui.dashboard.set_timer_anchors(step_start, story_start, total_start)
+            tui.dashboard.begin_step(StepKind.COMMIT, story_start, total_start)
 
-            tui.handle_event(TextEvent(
-                text=f"--- Committing: Story {story_id} ({story_key}) ---",
-                is_thinking=False,
-            ))
+            tui.emit_text(f"--- Committing: Story {story_id} ({story_key}) ---")
 
             commit_result = await run_commit_session(
                 story_id=story_id,
@@ -490,47 +467,34 @@ async def run_stories(config: SessionConfig, tui: TUI) -> int:
                 if await _check_story_committed(project_dir, story_key):
                     story_count += 1
                 else:
-                    tui.handle_event(TextEvent(
-                        text=f"ERROR: Commit session reported success but story {story_key} not found in git log. Story NOT counted as completed.",
-                        is_thinking=False,
-                    ))
+                    tui.emit_text(
+                        f"ERROR: Commit session reported success but story {story_key} not found in git log. Story NOT counted as completed.",
+                    )
             else:
-                tui.handle_event(TextEvent(
-                    text=f"ERROR: Commit failed for story {story_key}. Story NOT counted as completed.",
-                    is_thinking=False,
-                ))
-            _refresh_sprint_stats(sprint_status_path, tui)
+                tui.emit_text(f"ERROR: Commit failed for story {story_key}. Story NOT counted as completed.")
+            await _refresh_sprint_stats(sprint_status_path, tui)
         else:
-            status_data = load_status(sprint_status_path)
+            status_data = await _load_status(sprint_status_path)
             status = get_story_status(status_data, story_key)
-            tui.handle_event(TextEvent(
-                text=f"Story {story_key} is NOT done (status: {status}). Stopping.",
-                is_thinking=False,
-            ))
+            tui.emit_text(f"Story {story_key} is NOT done (status: {status}). Stopping.")
             break
 
         # Pause between stories
         if i < config.max_stories:
-            for sec in range(5, 0, -1):
-                tui.dashboard.countdown_message = f"Next story in {sec}s..."
-                await asyncio.sleep(1)
-            tui.dashboard.countdown_message = None
+            tui.dashboard.start_countdown(5, "Next story in {}s...")
+            await asyncio.sleep(5)
+            tui.dashboard.clear_countdown()
 
     # Session summary
-    tui.handle_event(TextEvent(
-        text=f"Session Complete. Stories completed: {story_count}. Logs: {log_dir}",
-        is_thinking=False,
-    ))
+    tui.emit_text(f"Session Complete. Stories completed: {story_count}. Logs: {log_dir}")
 
     return story_count
 
 
-def _refresh_sprint_stats(sprint_status_path: Path, tui: TUI) -> None:
+async def _refresh_sprint_stats(sprint_status_path: Path, tui: TUI) -> None:
     """Load sprint status and update dashboard counters. Failures are non-fatal."""
     try:
-        data = load_status(sprint_status_path)
-        total_epics, done_epics = count_epics(data)
-        total_stories, done_stories = count_stories(data)
-        tui.dashboard.update_sprint_stats(total_epics, done_epics, total_stories, done_stories)
+        data = await _load_status(sprint_status_path)
+        tui.dashboard.update_sprint_stats(*sprint_counts(data))
     except Exception:
         pass  # Sprint stats are cosmetic; don't crash the orchestrator
@@ -1,21 +1,115 @@
 """Sprint status YAML operations.
 
-Pure functions for loading and querying sprint-status.yaml.
-No file writing — Claude sessions update the YAML themselves.
+Pure functions for loading and querying sprint-status.yaml (loading is
+memoized on file mtime/size). No file writing — Claude sessions update the
+YAML themselves.
 """
 
 from __future__ import annotations
 
+import functools
 import re
 from pathlib import Path
 
 import yaml
 
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pure-Python fallback
+    from yaml import SafeLoader as _SafeLoader
+
+# Story key prefix ("<epic>-<story>-"), compiled once at import
+_STORY_KEY_RE = re.compile(r"\d+-\d+-")
+
+# Actionable statuses, most urgent first; see next_actionable_story()
+_ACTIONABLE_RANK = {"in-progress": 0, "review": 1, "ready-for-dev": 2, "backlog": 3}
+
+# Top-level "development_status:" header line (block style) and the next
+# line that starts in column 0, which ends that section
+_DEV_STATUS_HEADER_RE = re.compile(rb"^development_status:[ \t]*(?:#[^\n]*)?\r?$", re.MULTILINE)
+_TOP_LEVEL_LINE_RE = re.compile(rb"^[^\s#]", re.MULTILINE)
+
+# path → (st_mtime_ns, st_size, parsed data); see load_status()/load_dev_status()
+_STATUS_CACHE: dict[Path, tuple[int, int, dict]] = {}
+_DEV_STATUS_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
+
+def _cache_lookup(cache: dict[Path, tuple[int, int, dict]], path: Path, st) -> dict | None:
+    cached = cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    return None
+
+
+def _cached(cache: dict[Path, tuple[int, int, dict]], path: Path) -> dict | None:
+    if path not in cache:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return _cache_lookup(cache, path, st)
+
 
 def load_status(path: Path) -> dict:
-    """Load sprint-status.yaml and return the full dict."""
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    """Load sprint-status.yaml and return the full dict.
+
+    Parsed results are cached per path and reused while the file's mtime and
+    size are unchanged, so repeated calls cost a single stat(). Callers must
+    treat the returned dict as read-only.
+    """
+    st = path.stat()
+    data = _cache_lookup(_STATUS_CACHE, path, st)
+    if data is None:
+        data = yaml.load(path.read_bytes(), Loader=_SafeLoader) or {}
+        _STATUS_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _parse_dev_status(raw: bytes) -> dict:
+    """Parse only the development_status section of a sprint-status document.
+
+    The section is cut out at the byte level (header line up to the next
+    column-0 line) and only that slice is parsed. Anything the cut cannot
+    handle — flow style, quoted key, aliases into other sections — falls
+    back to parsing the whole document.
+    """
+    header = _DEV_STATUS_HEADER_RE.search(raw)
+    if header is not None:
+        after = _TOP_LEVEL_LINE_RE.search(raw, header.end())
+        section = raw[header.start():after.start() if after else len(raw)]
+        try:
+            data = yaml.load(section, Loader=_SafeLoader)
+        except yaml.YAMLError:
+            data = None
+        if isinstance(data, dict):
+            return data.get("development_status") or {}
+    data = yaml.load(raw, Loader=_SafeLoader) or {}
+    return data.get("development_status") or {}
+
+
+def load_dev_status(path: Path) -> dict:
+    """Load only the ``development_status`` mapping from sprint-status.yaml.
+
+    Everything the query helpers look at lives under this key, so other
+    sections are skipped rather than parsed. Cached on mtime/size like
+    load_status(); treat the result as read-only.
+    """
+    st = path.stat()
+    dev_status = _cache_lookup(_DEV_STATUS_CACHE, path, st)
+    if dev_status is None:
+        dev_status = _parse_dev_status(path.read_bytes())
+        _DEV_STATUS_CACHE[path] = (st.st_mtime_ns, st.st_size, dev_status)
+    return dev_status
+
+
+def cached_dev_status(path: Path) -> dict | None:
+    """Return load_dev_status()'s cached result for *path* if still current, else None.
+
+    Costs one stat(); lets async callers skip handing the parse to a thread
+    when the file has not changed.
+    """
+    return _cached(_DEV_STATUS_CACHE, path)
 
 
 def get_story_status(data: dict, key: str) -> str:
@@ -27,24 +121,34 @@ def get_story_status(data: dict, key: str) -> str:
 def next_actionable_story(data: dict) -> tuple[str, str] | None:
     """Return the highest-priority in-progress story as (key, status_string).
 
-    Priority order: in-progress > review > ready-for-dev > backlog.
-    Returns None if no actionable stories exist.
+    Priority order: in-progress > review > ready-for-dev > backlog; ties go
+    to the first key in file order. Returns None if no actionable stories
+    exist.
     """
     dev_status = data.get("development_status", {})
-    for target_status in ("in-progress", "review", "ready-for-dev", "backlog"):
-        for key, status in dev_status.items():
-            if re.match(r"\d+-\d+-", str(key)) and str(status) == target_status:
-                return (str(key), target_status)
-    return None
+    is_story = _STORY_KEY_RE.match
+    best_rank = len(_ACTIONABLE_RANK)
+    best: tuple[str, str] | None = None
+    for key, status in dev_status.items():
+        status = str(status)
+        rank = _ACTIONABLE_RANK.get(status)
+        if rank is None or rank >= best_rank or not isinstance(key, str) or not is_story(key):
+            continue
+        best_rank = rank
+        best = (key, status)
+        if rank == 0:
+            break  # nothing outranks in-progress
+    return best
 
 
 def find_done_stories(data: dict) -> list[str]:
     """Return all story keys with status 'done', sorted by (epic, story) descending."""
     dev_status = data.get("development_status", {})
     done_keys: list[str] = []
+    is_story = _STORY_KEY_RE.match
     for key, status in dev_status.items():
-        if re.match(r"\d+-\d+-", str(key)) and str(status) == "done":
-            done_keys.append(str(key))
+        if str(status) == "done" and isinstance(key, str) and is_story(key):
+            done_keys.append(key)
 
     def _sort_key(k: str) -> tuple[int, int]:
         parts = k.split("-")
@@ -57,12 +161,73 @@ def find_done_stories(data: dict) -> list[str]:
     return done_keys
 
 
+@functools.lru_cache(maxsize=1024)
 def story_id_from_key(key: str) -> str:
     """Extract epic.story from key (e.g., '1-3-stock-search' → '1.3')."""
-    parts = key.split("-")
-    if len(parts) >= 2:
-        return f"{parts[0]}.{parts[1]}"
-    return key
+    i = key.find("-")
+    if i < 0:
+        return key
+    j = key.find("-", i + 1)
+    if j < 0:
+        j = len(key)
+    return f"{key[:i]}.{key[i + 1:j]}"
+
+
+def _epic_number(key: str) -> str | None:
+    """Return N for an 'epic-N' key (without leading zeros), else None."""
+    if key.startswith("epic-") and key[5:].isdecimal():
+        return str(int(key[5:]))
+    return None
+
+
+def _story_epic(key: str) -> str | None:
+    """Return the epic part of an '<epic>-<story>-<slug>' key, else None.
+
+    Plain find/slice checks equivalent to matching r"(\\d+)-\\d+-.+"; this
+    runs for every key on every stats refresh.
+    """
+    i = key.find("-")
+    if i <= 0 or not key[:i].isdecimal():
+        return None
+    j = key.find("-", i + 1)
+    if j <= i + 1 or not key[i + 1:j].isdecimal():
+        return None
+    if j + 1 >= len(key) or key[j + 1] == "\n":
+        return None
+    return key[:i]
+
+
+def sprint_counts(data: dict) -> tuple[int, int, int, int]:
+    """Return (total_epics, done_epics, total_stories, done_stories) in one pass.
+
+    Each development_status key is classified once; epic completion is
+    tracked per epic number as stories are seen. See count_epics() for the
+    definition of a done epic.
+    """
+    dev_status = data.get("development_status", {})
+
+    epic_nums: list[str] = []
+    # epic number (as written in story keys) → all stories seen so far are done
+    epic_all_done: dict[str, bool] = {}
+    total_stories = 0
+    done_stories = 0
+    for key, status in dev_status.items():
+        if not isinstance(key, str):
+            continue
+        epic = _epic_number(key)
+        if epic is not None:
+            epic_nums.append(epic)
+            continue
+        epic = _story_epic(key)
+        if epic is not None:
+            total_stories += 1
+            is_done = str(status) == "done"
+            if is_done:
+                done_stories += 1
+            epic_all_done[epic] = epic_all_done.get(epic, True) and is_done
+
+    done_epics = sum(1 for n in epic_nums if epic_all_done.get(n, False))
+    return len(epic_nums), done_epics, total_stories, done_stories
 
 
 def count_epics(data: dict) -> tuple[int, int]:
@@ -72,37 +237,11 @@ def count_epics(data: dict) -> tuple[int, int]:
     regardless of the epic-N status field or the optional retrospective.
     Epics with no stories are not counted as done.
     """
-    dev_status = data.get("development_status", {})
-
-    # Collect epic numbers
-    epic_nums: list[int] = []
-    for key in dev_status:
-        m = re.match(r"epic-(\d+)$", str(key))
-        if m:
-            epic_nums.append(int(m.group(1)))
-
-    total = len(epic_nums)
-    done = 0
-    for n in epic_nums:
-        stories = [
-            (k, str(v))
-            for k, v in dev_status.items()
-            if re.match(rf"{n}-\d+-.+", str(k))
-        ]
-        if stories and all(status == "done" for _, status in stories):
-            done += 1
-
+    total, done, _, _ = sprint_counts(data)
     return total, done
 
 
 def count_stories(data: dict) -> tuple[int, int]:
     """Return (total_stories, done_stories) from sprint status data."""
-    dev_status = data.get("development_status", {})
-    total = 0
-    done = 0
-    for key, status in dev_status.items():
-        if re.match(r"\d+-\d+-.+", str(key)):
-            total += 1
-            if str(status) == "done":
-                done += 1
+    _, _, total, done = sprint_counts(data)
     return total, done
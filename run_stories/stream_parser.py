@@ -1,19 +1,24 @@
 """Stream parser for Claude CLI stream-json output.
 
-Pure, stateless: each call to parse_line() takes a raw JSON string
-and returns the appropriate StreamEvent dataclass. Never raises.
+Pure, stateless: each call to parse_line() takes a raw JSON line
+(str or undecoded bytes) and returns the appropriate StreamEvent dataclass. Never raises.
 """
 
 from __future__ import annotations
 
-import json
 import re
+from collections.abc import Callable
 from datetime import datetime, timezone
 
+try:  # optional faster decoder; same contract as json.loads for our input
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from .models import (
+    MARKER_TYPES_BY_TAG,
     InitEvent,
     MarkerEvent,
-    MarkerType,
     RateLimitEvent,
     ResultEvent,
     SystemEvent,
@@ -25,28 +30,83 @@ from .models import (
     summarize_tool_input,
 )
 
-# Matches paired markers like <HALT>reason</HALT> and self-closing like <NO_BACKLOG_STORIES/>
+# Matches paired markers like <HALT>reason</HALT> and self-closing like <NO_BACKLOG_STORIES/>.
+# Kept as two scans: a self-closing marker inside a paired payload must
+# still be reported, which a single alternation would swallow.
 _MARKER_PAIRED_RE = re.compile(
     r"<(HALT|CREATE_STORY_COMPLETE|DEV_STORY_COMPLETE|CODE_REVIEW_APPROVED|CODE_REVIEW_ISSUES)>(.*?)</\1>",
     re.DOTALL,
 )
 _MARKER_SELF_RE = re.compile(r"<(NO_BACKLOG_STORIES|NO_READY_STORIES)\s*/>")
 
+# Bytes-level prescreen for lines whose events nobody consumes. Claude CLI
+# emits compact JSON with "type" first, so a prefix check identifies them.
+_HOOK_PREFIX = b'{"type":"system","subtype":"hook_'
+_USER_PREFIX = b'{"type":"user",'
+_TEXT_BLOCK = b'"type":"text"'
+
+
+def is_ignorable(raw: bytes) -> bool:
+    """Return True if *raw* can only produce events that are never used.
+
+    Hook notifications and user messages without any text block (i.e. bare
+    tool results, typically the bulkiest lines in a session) are neither
+    rendered nor acted on, so callers may skip parse_line() for them.
+    Errs on the side of False: anything not positively identified is parsed.
+    """
+    if raw.startswith(_HOOK_PREFIX):
+        return True
+    return raw.startswith(_USER_PREFIX) and _TEXT_BLOCK not in raw
+
 
-def parse_line(raw: str) -> list[StreamEvent]:
+# Shared result for blank lines and messages with no content blocks: nothing
+# downstream reads their raw_data, and the event is frozen. Callers only
+# iterate parse_line() results, so the list itself is shared too.
+_EMPTY_EVENTS: list[StreamEvent] = [UnknownEvent(raw_data="")]
+
+
+def _unknown_line(raw: str | bytes) -> UnknownEvent:
+    """Wrap a line that is not a JSON object, decoded and stripped."""
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", errors="replace")
+    return UnknownEvent(raw_data=raw.strip())
+
+
+def parse_line(raw: str | bytes, show_thinking: bool = True) -> list[StreamEvent]:
     """Parse a single JSON line into one or more StreamEvent objects.
 
-    Returns a list because a single assistant text block may contain both
-    a TextEvent and a MarkerEvent. Returns [UnknownEvent] on any failure.
+    Accepts raw subprocess bytes directly — the JSON decoder handles UTF-8 in C,
+    so callers need not decode first. Returns a list because a single
+    assistant text block may contain both a TextEvent and a MarkerEvent.
+    With ``show_thinking=False`` thinking blocks are dropped without
+    allocating events, so a thinking-only message yields an empty list.
+    Returns [UnknownEvent] on any failure. The result may be shared between
+    calls and must not be mutated.
     """
-    raw = raw.strip()
-    if not raw:
-        return [UnknownEvent(raw_data="")]
+    # json.loads tolerates surrounding whitespace, so avoid copying the
+    # (often tens-of-KB) line with strip() on the common path
+    if not raw or raw.isspace():
+        return _EMPTY_EVENTS
+
+    # Every stream-json message is an object: anything else that doesn't
+    # start with "{" or whitespace is rejected without a failed json.loads
+    first = raw[:1]
+    if first != b"{" and first != "{" and not first.isspace():
+        return [_unknown_line(raw)]
 
     try:
-        data = json.loads(raw)
-    except (json.JSONDecodeError, ValueError):
-        return [UnknownEvent(raw_data=raw)]
+        data = _json_loads(raw)
+    except ValueError:  # includes json/orjson JSONDecodeError, UnicodeDecodeError
+        if not isinstance(raw, bytes):
+            return [_unknown_line(raw)]
+        # One invalid UTF-8 byte (e.g. echoed from tool output) must not cost
+        # the whole message; json raises UnicodeDecodeError and orjson a
+        # JSONDecodeError for it, so retry on the replacement-decoded text
+        text = raw.decode("utf-8", errors="replace")
+        try:
+            data = _json_loads(text)
+        except ValueError:
+            return [_unknown_line(text)]
 
     if not isinstance(data, dict):
         return [UnknownEvent(raw_data=data)]
@@ -54,19 +114,12 @@ def parse_line(raw: str) -> list[StreamEvent]:
     msg_type = data.get("type", "")
 
     try:
-        match msg_type:
-            case "system":
-                return _parse_system(data)
-            case "assistant":
-                return _parse_assistant(data)
-            case "user":
-                return _parse_user(data)
-            case "result":
-                return _parse_result(data)
-            case "rate_limit_event":
-                return _parse_rate_limit(data)
-            case _:
-                return [UnknownEvent(raw_data=data)]
+        if msg_type == "assistant":  # the bulk of the stream; needs show_thinking
+            return _parse_assistant(data, show_thinking)
+        parser = _MESSAGE_PARSERS.get(msg_type)
+        if parser is None:
+            return [UnknownEvent(raw_data=data)]
+        return parser(data)
     except Exception:
         return [UnknownEvent(raw_data=data)]
 
@@ -85,8 +138,9 @@ def _parse_system(data: dict) -> list[StreamEvent]:
     return [SystemEvent(subtype=subtype)]
 
 
-def _parse_assistant(data: dict) -> list[StreamEvent]:
+def _parse_assistant(data: dict, show_thinking: bool = True) -> list[StreamEvent]:
     events: list[StreamEvent] = []
+    skipped_thinking = False
     message = data.get("message", {})
     content_list = message.get("content", [])
 
@@ -103,10 +157,15 @@ def _parse_assistant(data: dict) -> list[StreamEvent]:
                 summary = summarize_tool_input(name, input_data) if isinstance(input_data, dict) else str(input_data)[:60]
                 events.append(ToolUseEvent(tool_name=name, input_summary=summary))
             case "thinking":
+                if not show_thinking:
+                    skipped_thinking = True
+                    continue
                 text = block.get("thinking", "")
                 events.append(TextEvent(text=text, is_thinking=True))
 
-    return events if events else [UnknownEvent(raw_data=data)]
+    if events or skipped_thinking:
+        return events
+    return _EMPTY_EVENTS
 
 
 def _parse_user(data: dict) -> list[StreamEvent]:
@@ -136,20 +195,22 @@ def _parse_user(data: dict) -> list[StreamEvent]:
                 text = block.get("text", "")
                 events.append(TextEvent(text=text, is_thinking=False))
 
-    return events if events else [UnknownEvent(raw_data=data)]
+    return events if events else _EMPTY_EVENTS
 
 
 def _parse_result(data: dict) -> list[StreamEvent]:
     cost = data.get("total_cost_usd")
     if cost is None:
         cost = data.get("cost_usd")
+    if cost is not None and type(cost) is not float:  # JSON decimals already are
+        cost = float(cost)
     return [
         ResultEvent(
             duration_ms=data.get("duration_ms", 0),
             num_turns=data.get("num_turns", 0),
             is_error=data.get("is_error", False),
             subtype=data.get("subtype", ""),
-            cost_usd=float(cost) if cost is not None else None,
+            cost_usd=cost,
         )
     ]
 
@@ -172,23 +233,32 @@ def _parse_rate_limit(data: dict) -> list[StreamEvent]:
     ]
 
 
+# Top-level message "type" → parser, for everything except "assistant"
+_MESSAGE_PARSERS: dict[str, Callable[[dict], list[StreamEvent]]] = {
+    "system": _parse_system,
+    "user": _parse_user,
+    "result": _parse_result,
+    "rate_limit_event": _parse_rate_limit,
+}
+
+
 def _detect_markers(text: str) -> list[MarkerEvent]:
-    """Scan text for XML orchestration markers."""
-    markers: list[MarkerEvent] = []
+    """Scan text for XML orchestration markers, in order of appearance."""
+    if "<" not in text:
+        return []  # most text blocks carry no markup; skip both regex scans
+    found: list[tuple[int, MarkerEvent]] = []
 
     for match in _MARKER_PAIRED_RE.finditer(text):
-        tag = match.group(1)
-        payload = match.group(2)
-        try:
-            markers.append(MarkerEvent(marker_type=MarkerType(tag), payload=payload))
-        except ValueError:
-            pass
+        marker_type = MARKER_TYPES_BY_TAG.get(match.group(1))
+        if marker_type is not None:
+            found.append((match.start(), MarkerEvent(marker_type=marker_type, payload=match.group(2))))
 
+    n_paired = len(found)
     for match in _MARKER_SELF_RE.finditer(text):
-        tag = match.group(1)
-        try:
-            markers.append(MarkerEvent(marker_type=MarkerType(tag), payload=""))
-        except ValueError:
-            pass
+        marker_type = MARKER_TYPES_BY_TAG.get(match.group(1))
+        if marker_type is not None:
+            found.append((match.start(), MarkerEvent(marker_type=marker_type, payload="")))
 
-    return markers
+    if n_paired and len(found) > n_paired:  # each scan is already in text order
+        found.sort(key=lambda item: item[0])
+    return [marker for _, marker in found]
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import functools
+import math
 import time
-from datetime import datetime, timezone
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
 
 from rich.console import Group, RenderableType
+from rich.style import Style
 from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -24,12 +30,11 @@ from .models import (
     StreamEvent,
     SystemEvent,
     TextEvent,
-    ToolResultEvent,
     ToolUseEvent,
-    UnknownEvent,
 )
 
 
+@functools.lru_cache(maxsize=256)
 def _format_duration(ms: int) -> str:
     """Format milliseconds as 'Xm YYs'."""
     total_s = ms // 1000
@@ -41,13 +46,19 @@ def _format_duration(ms: int) -> str:
 
 def _format_elapsed(seconds: float) -> str:
     """Format seconds as 'Xm YYs'."""
-    total_s = int(seconds)
+    return _format_whole_seconds(int(seconds))
+
+
+@functools.lru_cache(maxsize=256)
+def _format_whole_seconds(total_s: int) -> str:
+    # Live timers re-render the same second ~4 times (0.25s refresh)
     m, s = divmod(total_s, 60)
     if m > 0:
         return f"{m}m{s:02d}s"
     return f"{s}s"
 
 
+@functools.lru_cache(maxsize=256)
 def _format_cost(cost: float | None) -> str:
     if cost is None:
         return "N/A"
@@ -61,6 +72,113 @@ _STEP_LABELS = {
     StepKind.COMMIT: "Commit",
 }
 
+# Lines whose content never changes, built once and shared by
+# every frame (rich does not mutate a Text while rendering it)
+_BLANK_LINE = Text("")
+_NO_STORY_LINE = Text("No active story", style="dim")
+_WAITING_LINE = Text("Waiting for events...", style="dim italic")
+_PENDING_STEP_LINES = {kind: Text(f"  ○ {label}", style="dim") for kind, label in _STEP_LABELS.items()}
+
+
+@functools.lru_cache(maxsize=256)
+def _step_result_line(label: str, success: bool, num_turns: int, duration_ms: int, cost_usd: float | None) -> Text:
+    """Dashboard line for a finished step; results never change once recorded."""
+    marker = "✓" if success else "✗"
+    return Text(
+        f"  {marker} {label:8s}  {num_turns} turns  {_format_duration(duration_ms)}  {_format_cost(cost_usd)}",
+        style="green" if success else "red",
+    )
+
+
+# Activity-log line styles, parsed once rather than looked up per render
+_STYLE_DIM = Style.parse("dim")
+_STYLE_THINKING = Style.parse("dim italic")
+_STYLE_TEXT = Style.parse("white")
+_STYLE_HALT = Style.parse("bold red")
+_STYLE_OK = Style.parse("bold green")
+_STYLE_INIT = Style.parse("cyan")
+_STYLE_WARN = Style.parse("bold yellow")
+_STYLE_IDLE = Style.parse("dim italic")
+
+# Dashboard styles for lines rebuilt as the frame changes
+_STYLE_TITLE = Style.parse("bold")
+_STYLE_ACTIVE_STEP = Style.parse("bold white")
+_STYLE_SPRINT = Style.parse("cyan")
+_STYLE_COUNTDOWN = Style.parse("yellow")
+
+
+def _line(text: str, style: Style) -> Text:
+    """Single-row activity-log line; overlong text is cut with an ellipsis."""
+    return Text(text, style=style, no_wrap=True, overflow="ellipsis")
+
+
+# Tool calls repeat (same Read/Grep/Bash summaries over and over), so their
+# lines are shared; other events are mostly unique text or time-dependent
+@functools.lru_cache(maxsize=1024)
+def _tool_use_line(tool_name: str, input_summary: str) -> Text:
+    return _line(f"● {tool_name} {input_summary}", _STYLE_DIM)
+
+
+def _render_tool_use(event: ToolUseEvent, show_thinking: bool) -> Text:
+    return _tool_use_line(event.tool_name, event.input_summary)
+
+
+def _render_text(event: TextEvent, show_thinking: bool) -> Text | None:
+    if event.is_thinking:
+        if not show_thinking:
+            return None
+        return _line(f"💭 {event.text}", _STYLE_THINKING)
+    return _line(f"◆ {event.text}", _STYLE_TEXT)
+
+
+def _render_marker(event: MarkerEvent, show_thinking: bool) -> Text:
+    style = _STYLE_HALT if event.marker_type == MarkerType.HALT else _STYLE_OK
+    return _line(f"▶ {event.marker_type.value}: {event.payload}", style)
+
+
+def _render_init(event: InitEvent, show_thinking: bool) -> Text:
+    return _line(f"Started: {event.model}, {len(event.tools)} tools, {event.permission_mode}", _STYLE_INIT)
+
+
+def _render_result(event: ResultEvent, show_thinking: bool) -> Text:
+    if event.is_error:
+        return _line(f"✗ Error: {event.num_turns} turns, {_format_duration(event.duration_ms)}", _STYLE_HALT)
+    return _line(
+        f"✓ Done: {event.num_turns} turns, {_format_duration(event.duration_ms)}, {_format_cost(event.cost_usd)}",
+        _STYLE_OK,
+    )
+
+
+def _render_rate_limit(event: RateLimitEvent, show_thinking: bool) -> Text | None:
+    if event.status == "allowed":
+        return None
+    if event.resets_at:
+        countdown = _format_elapsed(max(0, event.resets_at.timestamp() - time.time()))
+        return _line(f"⚠ Rate limited — resets in {countdown}", _STYLE_WARN)
+    return _line("⚠ Rate limited", _STYLE_WARN)
+
+
+_TASK_STARTED_LINE = _line("⚙ task_started", _STYLE_DIM)
+
+
+def _render_system(event: SystemEvent, show_thinking: bool) -> Text | None:
+    if event.subtype == "task_started":
+        return _TASK_STARTED_LINE
+    return None  # skip hooks
+
+
+# One-line renderer per event type; types not listed (tool results, unknown
+# events) are not shown
+_EVENT_RENDERERS: dict[type, Callable[[Any, bool], Text | None]] = {
+    ToolUseEvent: _render_tool_use,
+    TextEvent: _render_text,
+    MarkerEvent: _render_marker,
+    InitEvent: _render_init,
+    ResultEvent: _render_result,
+    RateLimitEvent: _render_rate_limit,
+    SystemEvent: _render_system,
+}
+
 
 class ActivityLog:
     """Manages a scrollable list of rendered one-liners.
@@ -73,13 +191,16 @@ class ActivityLog:
     _IDLE_THRESHOLD: float = 15.0  # seconds before showing idle indicator
 
     def __init__(self, max_lines: int = 2000, show_tools: bool = False) -> None:
-        self._lines: list[tuple[Text, bool]] = []  # (rendered_text, is_tool_use)
-        self._max_lines = max_lines
+        # (rendered_text, is_tool_use); the oldest line drops off once full
+        self._lines: deque[tuple[Text, bool]] = deque(maxlen=max_lines)
         self.auto_scroll = True
         self.scroll_offset = 0  # lines from bottom
         self._new_lines_since_pause: int = 0
         self._show_tools: bool = show_tools
         self._visible_cache: list[Text] | None = None
+        self._version: int = 0  # bumped whenever _lines changes
+        self._render_key: tuple | None = None
+        self._render_cache: RenderableType | None = None
         self._session_active: bool = False
         self._last_event_at: float = 0  # monotonic timestamp
 
@@ -103,16 +224,24 @@ class ActivityLog:
         if active:
             self._last_event_at = time.monotonic()
 
-    def add_event(self, event: StreamEvent, show_thinking: bool = False) -> None:
+    def add_event(self, event: StreamEvent, show_thinking: bool = False, now: float | None = None) -> None:
+        """Render and store *event*; *now* (monotonic) lets a batch share one clock read."""
         line = self._render_event(event, show_thinking)
         if line is not None:
             is_tool = isinstance(event, ToolUseEvent)
-            self._lines.append((line, is_tool))
-            self._last_event_at = time.monotonic()
-            self._visible_cache = None
-            if len(self._lines) > self._max_lines:
-                self._lines = self._lines[-self._max_lines:]
-                self._visible_cache = None
+            lines = self._lines
+            # The line about to be dropped off the front, if the log is full
+            evicted = lines[0] if len(lines) == lines.maxlen else None
+            lines.append((line, is_tool))
+            self._version += 1
+            self._last_event_at = time.monotonic() if now is None else now
+            # Keep the filtered view in step rather than rebuilding it per frame
+            cache = self._visible_cache
+            if cache is not None:
+                if evicted is not None and (self._show_tools or not evicted[1]):
+                    del cache[0]
+                if self._show_tools or not is_tool:
+                    cache.append(line)
             if self.auto_scroll:
                 self.scroll_offset = 0
             else:
@@ -121,46 +250,8 @@ class ActivityLog:
                     self._new_lines_since_pause += 1
 
     def _render_event(self, event: StreamEvent, show_thinking: bool) -> Text | None:
-        _kw = {"no_wrap": True, "overflow": "ellipsis"}
-        match event:
-            case ToolUseEvent(tool_name=name, input_summary=summary):
-                return Text(f"● {name} {summary}", style="dim", **_kw)
-            case ToolResultEvent():
-                return None  # skip, too noisy
-            case TextEvent(text=text, is_thinking=True):
-                if not show_thinking:
-                    return None
-                return Text(f"💭 {text}", style="dim italic", **_kw)
-            case TextEvent(text=text, is_thinking=False):
-                return Text(f"◆ {text}", style="white", **_kw)
-            case MarkerEvent(marker_type=mt, payload=payload):
-                style = "bold red" if mt == MarkerType.HALT else "bold green"
-                return Text(f"▶ {mt.value}: {payload}", style=style, **_kw)
-            case InitEvent(model=model, tools=tools, permission_mode=pm):
-                return Text(f"Started: {model}, {len(tools)} tools, {pm}", style="cyan", **_kw)
-            case ResultEvent(num_turns=turns, duration_ms=dur, cost_usd=cost, is_error=err):
-                if err:
-                    return Text(f"✗ Error: {turns} turns, {_format_duration(dur)}", style="bold red", **_kw)
-                return Text(
-                    f"✓ Done: {turns} turns, {_format_duration(dur)}, {_format_cost(cost)}",
-                    style="bold green",
-                    **_kw,
-                )
-            case RateLimitEvent(status=status, resets_at=resets_at):
-                if status == "allowed":
-                    return None
-                if resets_at:
-                    delta = (resets_at - datetime.now(timezone.utc)).total_seconds()
-                    countdown = _format_elapsed(max(0, delta))
-                    return Text(f"⚠ Rate limited — resets in {countdown}", style="bold yellow", **_kw)
-                return Text("⚠ Rate limited", style="bold yellow", **_kw)
-            case SystemEvent(subtype=st):
-                if st == "task_started":
-                    return Text(f"⚙ {st}", style="dim", **_kw)
-                return None  # skip hooks
-            case UnknownEvent():
-                return None
-        return None
+        renderer = _EVENT_RENDERERS.get(type(event))
+        return renderer(event, show_thinking) if renderer is not None else None
 
     def _visible_lines(self) -> list[Text]:
         """Return lines filtered by current show_tools setting (cached)."""
@@ -175,19 +266,29 @@ class ActivityLog:
 
     def render(self, height: int = 30) -> RenderableType:
         if not self._lines:
-            return Text("Waiting for events...", style="dim italic")
+            return _WAITING_LINE
 
         lines = self._visible_lines()
         if not lines:
-            return Text("Waiting for events...", style="dim italic")
+            return _WAITING_LINE
 
         show_indicator = not self.auto_scroll and self._new_lines_since_pause > 0
-        show_idle = (
-            self._session_active
-            and self._last_event_at > 0
-            and (time.monotonic() - self._last_event_at) >= self._IDLE_THRESHOLD
+        idle_label: str | None = None
+        if self._session_active and self._last_event_at > 0:
+            idle = time.monotonic() - self._last_event_at
+            if idle >= self._IDLE_THRESHOLD:
+                idle_label = f"⏳ Processing... ({_format_elapsed(idle)} since last output)"
+
+        # The app re-renders every 0.25s; reuse the last frame when nothing
+        # that feeds into it has changed
+        key = (
+            self._version, height, self.scroll_offset, self._show_tools,
+            self._new_lines_since_pause if show_indicator else 0, idle_label,
         )
-        reserved = (1 if show_indicator else 0) + (1 if show_idle else 0)
+        if key == self._render_key and self._render_cache is not None:
+            return self._render_cache
+
+        reserved = (1 if show_indicator else 0) + (1 if idle_label else 0)
         content_height = max(1, height - reserved)
 
         # Clamp scroll_offset so we never scroll past the first line
@@ -197,17 +298,18 @@ class ActivityLog:
         end = len(lines) - self.scroll_offset
         start = max(0, end - content_height)
         end = max(start, end)
-        visible = list(lines[start:end])
+        visible = lines[start:end]  # a fresh list, safe to extend
 
         if show_indicator:
-            visible.append(Text(f"▼ {self._new_lines_since_pause} new lines", style="bold yellow"))
+            visible.append(Text(f"▼ {self._new_lines_since_pause} new lines", style=_STYLE_WARN))
 
         # Idle indicator: show when a session is running but no events arrived recently
-        if show_idle:
-            idle = time.monotonic() - self._last_event_at
-            visible.append(Text(f"⏳ Processing... ({_format_elapsed(idle)} since last output)", style="dim italic"))
+        if idle_label:
+            visible.append(Text(idle_label, style=_STYLE_IDLE))
 
-        return Group(*visible)
+        self._render_key = (*key[:2], self.scroll_offset, *key[3:])
+        self._render_cache = Group(*visible)
+        return self._render_cache
 
     def scroll_up(self, lines: int = 3) -> None:
         self.auto_scroll = False
@@ -236,6 +338,9 @@ class Dashboard:
         self.rate_limit_active: bool = False
         self.rate_limit_resets_at: datetime | None = None
         self.countdown_message: str | None = None
+        # Live countdown: monotonic deadline (0 = none) and message template
+        self._countdown_deadline: float = 0
+        self._countdown_template: str = ""
         # Timer anchors (monotonic timestamps) for live ticking
         self._step_start: float = 0
         self._story_start: float = 0
@@ -245,6 +350,8 @@ class Dashboard:
         self.done_epics: int = 0
         self.total_stories: int = 0
         self.done_stories: int = 0
+        self._render_key: tuple | None = None
+        self._render_cache: RenderableType | None = None
 
     def update_state(
         self,
@@ -268,6 +375,13 @@ class Dashboard:
         self._story_start = story_start
         self._total_start = total_start
 
+    def begin_step(self, step: StepKind, story_start: float, total_start: float) -> None:
+        """Enter *step*: mark it current, clear the step cost, restart the step timer."""
+        if self.story_state is not None:
+            self.story_state.current_step = step
+        self.step_cost = None
+        self.set_timer_anchors(time.monotonic(), story_start, total_start)
+
     def freeze_timers(self) -> None:
         """Freeze all timers at their current values by clearing anchors."""
         now = time.monotonic()
@@ -294,6 +408,20 @@ class Dashboard:
         self.total_stories = total_stories
         self.done_stories = done_stories
 
+    def start_countdown(self, seconds: float, template: str) -> None:
+        """Show a countdown computed at render time.
+
+        *template* is formatted with the remaining whole seconds, e.g.
+        ``"Next story in {}s..."``. Replaces any static countdown_message.
+        """
+        self._countdown_deadline = time.monotonic() + seconds
+        self._countdown_template = template
+
+    def clear_countdown(self) -> None:
+        """Remove the live countdown and any static countdown message."""
+        self._countdown_deadline = 0
+        self.countdown_message = None
+
     def update_rate_limit(self, active: bool, resets_at: datetime | None = None) -> None:
         self.rate_limit_active = active
         self.rate_limit_resets_at = resets_at
@@ -308,31 +436,53 @@ class Dashboard:
         if self._total_start > 0:
             self.total_elapsed = now - self._total_start
 
+        rate_limit_left: float | None = None
+        if self.rate_limit_active and self.rate_limit_resets_at:
+            rate_limit_left = max(0, self.rate_limit_resets_at.timestamp() - time.time())
+        countdown = self.countdown_message
+        if self._countdown_deadline > 0:
+            remaining = max(0, math.ceil(self._countdown_deadline - now))
+            countdown = self._countdown_template.format(remaining)
+
+        # Timers only show whole seconds, so most 0.25s ticks would produce
+        # the same frame; reuse it unless something displayed has changed
+        ss = self.story_state
+        key = (
+            int(self.step_elapsed), int(self.story_elapsed), int(self.total_elapsed),
+            None if ss is None else (
+                id(ss), ss.story_key, ss.story_id, ss.current_step, ss.current_round, len(ss.step_results),
+            ),
+            self.story_number, self.step_cost, self.total_cost,
+            self.total_epics, self.done_epics, self.total_stories, self.done_stories,
+            None if rate_limit_left is None else int(rate_limit_left), countdown,
+        )
+        if key == self._render_key and self._render_cache is not None:
+            return self._render_cache
+
         lines: list[Text] = []
 
-        if self.story_state is None:
-            lines.append(Text("No active story", style="dim"))
+        if ss is None:
+            lines.append(_NO_STORY_LINE)
         else:
-            ss = self.story_state
-            lines.append(Text(f"Story {self.story_number}: {ss.story_key} ({ss.story_id})", style="bold"))
-            lines.append(Text(""))
+            lines.append(Text(f"Story {self.story_number}: {ss.story_key} ({ss.story_id})", style=_STYLE_TITLE))
+            lines.append(_BLANK_LINE)
 
             # Mini-history: show every result with per-round timing
-            all_kinds = [StepKind.CS, StepKind.DS, StepKind.CR, StepKind.COMMIT]
+            # Count completed results per kind
+            kind_counts: dict[StepKind, int] = {}
+            for r in ss.step_results:
+                kind_counts[r.kind] = kind_counts.get(r.kind, 0) + 1
 
             # Determine if the current step is still in-progress
             active_in_progress = False
             if ss.current_step is not None:
-                n_done = sum(1 for r in ss.step_results if r.kind == ss.current_step)
+                n_done = kind_counts.get(ss.current_step, 0)
                 if ss.current_step in (StepKind.DS, StepKind.CR):
                     active_in_progress = ss.current_round > n_done
                 else:
                     active_in_progress = n_done == 0
 
-            # Count completed results per kind & decide which need round labels
-            kind_counts: dict[StepKind, int] = {}
-            for r in ss.step_results:
-                kind_counts[r.kind] = kind_counts.get(r.kind, 0) + 1
+            # Decide which kinds need round labels
             needs_round: set[StepKind] = {k for k, c in kind_counts.items() if c > 1}
             if active_in_progress and ss.current_step in kind_counts:
                 needs_round.add(ss.current_step)
@@ -344,36 +494,30 @@ class Dashboard:
                 label = _STEP_LABELS[r.kind]
                 if r.kind in needs_round:
                     label = f"{label} r{round_idx[r.kind]}"
-                marker = "✗" if not r.success else "✓"
-                style = "red" if not r.success else "green"
-                line = Text(
-                    f"  {marker} {label:8s}  {r.num_turns} turns  {_format_duration(r.duration_ms)}  {_format_cost(r.cost_usd)}",
-                    style=style,
-                )
-                lines.append(line)
+                lines.append(_step_result_line(label, r.success, r.num_turns, r.duration_ms, r.cost_usd))
 
             # 2) Currently active step
             if active_in_progress:
                 label = _STEP_LABELS[ss.current_step]
                 if ss.current_step in needs_round:
                     label = f"{label} r{ss.current_round}"
-                line = Text(f"  ● {label:8s}  {_format_elapsed(self.step_elapsed)}", style="bold white")
+                line = Text(f"  ● {label:8s}  {_format_elapsed(self.step_elapsed)}", style=_STYLE_ACTIVE_STEP)
                 lines.append(line)
 
             # 3) Pending steps (kinds not yet seen and not active)
             seen = set(kind_counts)
             if ss.current_step is not None:
                 seen.add(ss.current_step)
-            for kind in all_kinds:
+            for kind, pending_line in _PENDING_STEP_LINES.items():
                 if kind not in seen:
-                    lines.append(Text(f"  ○ {_STEP_LABELS[kind]}", style="dim"))
+                    lines.append(pending_line)
 
-            lines.append(Text(""))
+            lines.append(_BLANK_LINE)
 
         # Sprint overview
         if self.total_epics > 0 or self.total_stories > 0:
             sprint = f"Sprint: {self.done_epics}/{self.total_epics} epics | {self.done_stories}/{self.total_stories} stories done"
-            lines.append(Text(sprint, style="cyan"))
+            lines.append(Text(sprint, style=_STYLE_SPRINT))
 
         # Timers
         timers = f"Step: {_format_elapsed(self.step_elapsed)}  |  Story: {_format_elapsed(self.story_elapsed)}  |  Total: {_format_elapsed(self.total_elapsed)}"
@@ -385,29 +529,59 @@ class Dashboard:
         lines.append(Text(f"Cost: {step_cost_str} (step) / {total_cost_str} (total)"))
 
         # Rate limit
-        if self.rate_limit_active and self.rate_limit_resets_at:
-            delta = (self.rate_limit_resets_at - datetime.now(timezone.utc)).total_seconds()
-            countdown = _format_elapsed(max(0, delta))
-            lines.append(Text(f"⚠ Rate limited — resets in {countdown}", style="bold yellow"))
+        if rate_limit_left is not None:
+            lines.append(Text(f"⚠ Rate limited — resets in {_format_elapsed(rate_limit_left)}", style=_STYLE_WARN))
 
         # Countdown between stories
-        if self.countdown_message:
-            lines.append(Text(""))
-            lines.append(Text(self.countdown_message, style="yellow"))
+        if countdown:
+            lines.append(_BLANK_LINE)
+            lines.append(Text(countdown, style=_STYLE_COUNTDOWN))
 
-        return Group(*lines)
+        self._render_key = key
+        self._render_cache = Group(*lines)
+        return self._render_cache
 
 
 class TUI:
-    """Top-level TUI data coordinator — dispatches events to ActivityLog and Dashboard."""
+    """Top-level TUI data coordinator — dispatches events to ActivityLog and Dashboard.
+
+    Only ever touched from the event-loop thread, so there are no locks:
+    high-volume stream events are appended to a deque by queue_event() and
+    applied once per frame; handle_event() is for the occasional status line.
+    """
 
     def __init__(self, show_thinking: bool = False, show_tools: bool = False) -> None:
         self.activity_log = ActivityLog(show_tools=show_tools)
         self.dashboard = Dashboard()
         self.show_thinking = show_thinking
+        self._pending: deque[StreamEvent] = deque()
+
+    def queue_event(self, event: StreamEvent) -> None:
+        """Defer an event until the next drain_pending() (once per frame)."""
+        self._pending.append(event)
+
+    def drain_pending(self) -> None:
+        """Apply all queued events in arrival order."""
+        pending = self._pending
+        if not pending:
+            return
+        # The idle indicator only needs frame precision, so a batch shares one timestamp
+        now = time.monotonic()
+        while pending:
+            self._apply_event(pending.popleft(), now)
 
     def handle_event(self, event: StreamEvent) -> None:
-        self.activity_log.add_event(event, self.show_thinking)
+        """Apply an event immediately, after any queued ones to keep ordering."""
+        if self._pending:
+            self.drain_pending()
+        self._apply_event(event)
+
+    def emit_text(self, text: str) -> None:
+        """Show an orchestrator status line (shorthand for a non-thinking TextEvent)."""
+        self.handle_event(TextEvent(text=text, is_thinking=False))
+
+    def _apply_event(self, event: StreamEvent, now: float | None = None) -> None:
+        self.activity_log.add_event(event, self.show_thinking, now)
 
         match event:
             case ResultEvent(cost_usd=cost):
@@ -433,10 +607,18 @@ class ActivityLogWidget(Static):
     def __init__(self, activity_log: ActivityLog) -> None:
         super().__init__()
         self._log = activity_log
+        self._last_frame: RenderableType | None = None
 
     def render(self) -> RenderableType:
         return self._log.render(height=max(1, self.size.height - 2))
 
+    def refresh_if_changed(self) -> None:
+        """Repaint only if the log would produce a different frame."""
+        frame = self.render()
+        if frame is not self._last_frame:
+            self._last_frame = frame
+            self.refresh()
+
     def on_mouse_scroll_up(self, event: MouseScrollUp) -> None:
         self._log.scroll_up(lines=3)
         self.refresh()
@@ -455,10 +637,19 @@ class DashboardWidget(Static):
     def __init__(self, dashboard: Dashboard) -> None:
         super().__init__()
         self._dash = dashboard
+        self._last_frame: RenderableType | None = None
 
     def render(self) -> RenderableType:
         return self._dash.render()
 
+    def refresh_if_changed(self) -> None:
+        """Repaint (and re-layout) only if the dashboard produced a new frame."""
+        frame = self.render()
+        if frame is not self._last_frame:
+            self._last_frame = frame
+            # layout=True: height:auto needs a layout pass to resize when content changes
+            self.refresh(layout=True)
+
 
 class StoryRunnerApp(App):
     """Top-level Textual app composing ActivityLogWidget and DashboardWidget."""
@@ -481,20 +672,25 @@ class StoryRunnerApp(App):
         self._config = config
         self._exit_code = 1
         self._finished = False
+        # Held directly so the refresh tick needn't query the DOM
+        self._activity_widget = ActivityLogWidget(tui.activity_log)
+        self._dashboard_widget = DashboardWidget(tui.dashboard)
 
     def compose(self) -> ComposeResult:
-        yield ActivityLogWidget(self._tui.activity_log)
-        yield DashboardWidget(self._tui.dashboard)
+        yield self._activity_widget
+        yield self._dashboard_widget
 
     def on_mount(self) -> None:
         self.set_interval(0.25, self._refresh_widgets)
         self.run_worker(self._run_orchestrator, thread=False)
 
     def _refresh_widgets(self) -> None:
-        activity_widget = self.query_one(ActivityLogWidget)
-        activity_widget.refresh()
-        # layout=True: height:auto needs a layout pass to resize when content changes
-        self.query_one(DashboardWidget).refresh(layout=True)
+        self._tui.drain_pending()
+        # Both models reuse their last frame when nothing shown has changed,
+        # so idle ticks skip the repaint (and the dashboard's layout pass)
+        activity_widget = self._activity_widget
+        activity_widget.refresh_if_changed()
+        self._dashboard_widget.refresh_if_changed()
         # Update border title to reflect tools visibility
         log = activity_widget._log
         activity_widget.border_title = "Activity Log [T]" if log.show_tools else "Activity Log"
@@ -511,19 +707,17 @@ class StoryRunnerApp(App):
             story_count = await _run_stories(self._config, self._tui)
             self._exit_code = 0 if story_count > 0 else 1
         except Exception as exc:
-            self._tui.handle_event(TextEvent(
-                text=f"FATAL: Orchestrator crashed: {exc}",
-                is_thinking=False,
-            ))
+            self._tui.emit_text(f"FATAL: Orchestrator crashed: {exc}")
             self._exit_code = 1
         finally:
             self._finished = True
             self._tui.dashboard.freeze_timers()
+            self._tui.dashboard.clear_countdown()
             self._tui.dashboard.countdown_message = "Finished -- press Enter to close"
 
     def action_toggle_tools(self) -> None:
         self._tui.activity_log.show_tools = not self._tui.activity_log.show_tools
-        self.query_one(ActivityLogWidget).refresh()
+        self._activity_widget.refresh()
 
     def action_close_if_finished(self) -> None:
         if self._finished:
@@ -534,7 +728,7 @@ class StoryRunnerApp(App):
             self._tui.activity_log.scroll_up(lines=abs(delta))
         elif delta > 0:
             self._tui.activity_log.scroll_down(lines=delta)
-        self.query_one(ActivityLogWidget).refresh()
+        self._activity_widget.refresh()
 
     def on_unmount(self) -> None:
         from .claude_session import cleanup_subprocess
@@ -0,0 +1,212 @@
+"""Tests for run_stories.claude_session with a fake `claude` executable on PATH."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import stat
+from pathlib import Path
+
+import pytest
+
+from run_stories import claude_session
+from run_stories.claude_session import _LineBlockProtocol, cleanup_subprocess, run_claude_session
+from run_stories.models import MarkerType, StepKind
+from run_stories.tui import TUI
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def fake_claude(tmp_path, monkeypatch):
+    """Install a `claude` script that replays a fixture log to stdout."""
+
+    def _install(fixture_name: str, exit_code: int = 0, then: str = "", first: str = "") -> Path:
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir(exist_ok=True)
+        script = bin_dir / "claude"
+        script.write_text(
+            "#!/bin/sh\n"
+            f"{first}\n"
+            f"cat '{FIXTURES_DIR / fixture_name}'\n"
+            f"{then}\n"
+            f"exit {exit_code}\n"
+        )
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+        return FIXTURES_DIR / fixture_name
+
+    return _install
+
+
+async def _run(tmp_path: Path, tui: TUI, step_kind: StepKind = StepKind.CR, timeout_minutes: float = 30):
+    prompt = tmp_path / "PROMPT.md"
+    prompt.write_text("Do the thing.")
+    log_file = tmp_path / "session.log"
+    result = await run_claude_session(
+        prompt_file=prompt,
+        log_file=log_file,
+        max_turns=10,
+        model="",
+        extra_prompt=None,
+        tui=tui,
+        project_dir=tmp_path,
+        step_kind=step_kind,
+        story_key="1-3-stock-search",
+        timeout_minutes=timeout_minutes,
+    )
+    return result, log_file
+
+
+class TestRunClaudeSession:
+    @pytest.mark.asyncio
+    async def test_log_is_byte_identical_to_stdout(self, tmp_path, fake_claude):
+        fixture = fake_claude("code-review.log")
+        _, log_file = await _run(tmp_path, TUI())
+        assert log_file.read_bytes() == fixture.read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_log_flushed_while_session_is_quiet(self, tmp_path, fake_claude):
+        fixture = fake_claude("code-review.log", then="sleep 1")
+        task = asyncio.create_task(_run(tmp_path, TUI()))
+        await asyncio.sleep(0.5)
+        # Output stopped mid-session; the buffered tail must already be on disk
+        assert (tmp_path / "session.log").read_bytes() == fixture.read_bytes()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_collects_markers_and_result(self, tmp_path, fake_claude):
+        fake_claude("code-review.log")
+        result, _ = await _run(tmp_path, TUI())
+        assert result.success is True
+        assert result.kind == StepKind.CR
+        assert result.num_turns > 0
+        assert any(m.marker_type == MarkerType.CODE_REVIEW_APPROVED for m in result.markers_detected)
+
+    @pytest.mark.asyncio
+    async def test_prompt_passed_on_stdin(self, tmp_path, fake_claude):
+        captured = tmp_path / "stdin.txt"
+        fake_claude("code-review.log", first=f"cat > '{captured}'")
+        prompt = tmp_path / "PROMPT.md"
+        prompt.write_text("Review it.")
+        await run_claude_session(
+            prompt_file=prompt,
+            log_file=tmp_path / "session.log",
+            max_turns=10,
+            model="",
+            extra_prompt="STORY_PATH: /x/1-3.md",
+            tui=TUI(),
+            project_dir=tmp_path,
+        )
+        assert captured.read_text() == "Review it.\n\nSTORY_PATH: /x/1-3.md"
+
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_is_failure(self, tmp_path, fake_claude):
+        fake_claude("create-story.log", exit_code=1)
+        result, _ = await _run(tmp_path, TUI(), step_kind=StepKind.CS)
+        assert result.success is False
+
+    @pytest.mark.asyncio
+    async def test_session_inactive_after_run(self, tmp_path, fake_claude):
+        fake_claude("dev-story.log")
+        tui = TUI()
+        await _run(tmp_path, tui, step_kind=StepKind.DS)
+        assert tui.activity_log._session_active is False
+        assert len(tui.activity_log._lines) > 0
+
+
+class TestSessionTimeout:
+    @pytest.mark.asyncio
+    async def test_hung_session_is_terminated(self, tmp_path, fake_claude):
+        fake_claude("create-story.log", then="exec sleep 30")
+        tui = TUI()
+        result, log_file = await asyncio.wait_for(
+            _run(tmp_path, tui, step_kind=StepKind.CS, timeout_minutes=0.01), timeout=5,
+        )
+        assert result.success is False
+        assert result.num_turns > 0  # result event arrived before the hang
+        assert log_file.stat().st_size > 0
+        texts = [line.plain for line, _ in tui.activity_log._lines]
+        assert any("SESSION TIMEOUT" in t for t in texts)
+
+    @pytest.mark.asyncio
+    async def test_orphaned_pipe_does_not_hang(self, tmp_path, fake_claude, monkeypatch):
+        # Background child keeps stdout open after the parent is terminated
+        monkeypatch.setattr(claude_session, "_TERMINATE_GRACE_SECS", 0.2)
+        pid_file = tmp_path / "orphan.pid"
+        fake_claude("create-story.log", then=f"sleep 30 &\necho $! > '{pid_file}'\nwait")
+        try:
+            result, _ = await asyncio.wait_for(
+                _run(tmp_path, TUI(), step_kind=StepKind.CS, timeout_minutes=0.01), timeout=5,
+            )
+        finally:
+            os.kill(int(pid_file.read_text()), signal.SIGKILL)
+            await asyncio.sleep(0.1)  # let the pipe transport observe EOF and close
+        assert result.success is False
+
+
+class TestCleanupSubprocess:
+    def test_noop_without_active_session(self):
+        cleanup_subprocess()  # must not raise
+
+    @pytest.mark.asyncio
+    async def test_terminates_running_session(self, tmp_path, fake_claude):
+        fake_claude("create-story.log", then="exec sleep 30")
+        task = asyncio.create_task(_run(tmp_path, TUI(), step_kind=StepKind.CS))
+        while not claude_session._active_pids:
+            await asyncio.sleep(0.01)
+        cleanup_subprocess()
+        result, _ = await asyncio.wait_for(task, timeout=5)
+        assert result.success is False
+        assert not claude_session._active_pids
+
+    @pytest.mark.asyncio
+    async def test_terminates_all_concurrent_sessions(self, tmp_path, fake_claude):
+        fake_claude("create-story.log", then="exec sleep 30")
+        dirs = [tmp_path / "a", tmp_path / "b"]
+        for d in dirs:
+            d.mkdir()
+        tasks = [asyncio.create_task(_run(d, TUI(), step_kind=StepKind.CS)) for d in dirs]
+        while len(claude_session._active_pids) < 2:
+            await asyncio.sleep(0.01)
+        cleanup_subprocess()
+        results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=5)
+        assert all(result.success is False for result, _ in results)
+        assert not claude_session._active_pids
+
+
+class TestLineBlockProtocol:
+    def _feed(self, *chunks: bytes) -> tuple[list[bytes], _LineBlockProtocol]:
+        blocks: list[bytes] = []
+        proto = _LineBlockProtocol(blocks.append)
+        for chunk in chunks:
+            proto.pipe_data_received(1, chunk)
+        proto.pipe_connection_lost(1, None)
+        return blocks, proto
+
+    @pytest.mark.asyncio
+    async def test_blocks_end_on_line_boundaries(self):
+        blocks, proto = self._feed(b'{"a":1}\n{"b', b'b":22}\n{"c":3}\n')
+        assert blocks == [b'{"a":1}\n', b'{"bb":22}\n{"c":3}\n']
+        assert proto.eof.done()
+
+    @pytest.mark.asyncio
+    async def test_line_spanning_many_reads(self):
+        blocks, _ = self._feed(b"x" * 10, b"x" * 10, b"x" * 10 + b"\n")
+        assert blocks == [b"x" * 30 + b"\n"]
+
+    @pytest.mark.asyncio
+    async def test_unterminated_tail_delivered_at_eof(self):
+        blocks, _ = self._feed(b"one\ntwo")
+        assert blocks == [b"one\n", b"two"]
+
+    @pytest.mark.asyncio
+    async def test_callback_error_surfaces_through_eof(self):
+        def boom(block: bytes) -> None:
+            raise OSError("disk full")
+
+        proto = _LineBlockProtocol(boom)
+        proto.pipe_data_received(1, b"line\n")
+        with pytest.raises(OSError):
+            await proto.eof
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import shutil
+import subprocess
 import tempfile
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -16,7 +20,13 @@ from run_stories.models import (
     StepKind,
     StepResult,
 )
-from run_stories.orchestrator import _load_status_safe, run_stories
+from run_stories.orchestrator import (
+    _check_git_dirty,
+    _committed_story_ids,
+    _first_uncommitted_story,
+    _load_status_safe,
+    run_stories,
+)
 from run_stories.tui import TUI
 
 
@@ -140,7 +150,7 @@ class TestCRRejectionLoop:
     async def test_retry_on_rejection(self, config, tui, tmp_project):
         sprint_status = tmp_project / "_bmad-output" / "implementation-artifacts" / "sprint-status.yaml"
         story_file = tmp_project / "_bmad-output" / "implementation-artifacts" / "1-2-next-story.md"
-        config.max_review_rounds = 3
+        config = replace(config, max_review_rounds=3)
 
         round_count = {"ds": 0, "cr": 0}
 
@@ -241,6 +251,39 @@ class TestNoActionableStories:
         mock_cs.assert_not_called()
 
 
+class TestPreflight:
+    """Missing prompt or sprint-status files abort before any session runs."""
+
+    @pytest.mark.asyncio
+    async def test_missing_sprint_status(self, config, tui, tmp_project):
+        sprint_status = tmp_project / "_bmad-output" / "implementation-artifacts" / "sprint-status.yaml"
+        sprint_status.unlink()
+
+        with patch("run_stories.orchestrator.shutil.which", return_value="/usr/bin/claude"), \
+             patch("run_stories.orchestrator.run_claude_session") as mock_cs:
+            count = await run_stories(config, tui)
+
+        assert count == 0
+        mock_cs.assert_not_called()
+        texts = [line.plain for line, _ in tui.activity_log._lines]
+        assert any(f"Required file not found: {sprint_status}" in t for t in texts)
+
+    @pytest.mark.asyncio
+    async def test_missing_prompt(self, config, tui, tmp_project, tmp_path_factory):
+        empty_pkg = tmp_path_factory.mktemp("pkg")
+        fake_module = empty_pkg / "orchestrator.py"
+
+        with patch("run_stories.orchestrator.shutil.which", return_value="/usr/bin/claude"), \
+             patch("run_stories.orchestrator.__file__", str(fake_module)), \
+             patch("run_stories.orchestrator.run_claude_session") as mock_cs:
+            count = await run_stories(config, tui)
+
+        assert count == 0
+        mock_cs.assert_not_called()
+        texts = [line.plain for line, _ in tui.activity_log._lines]
+        assert any("Required file not found" in t and "PROMPT-create-story.md" in t for t in texts)
+
+
 class TestMaxReviewRoundsExhausted:
     """Max review rounds reached → warning and break."""
 
@@ -248,7 +291,7 @@ class TestMaxReviewRoundsExhausted:
     async def test_max_rounds(self, config, tui, tmp_project):
         sprint_status = tmp_project / "_bmad-output" / "implementation-artifacts" / "sprint-status.yaml"
         story_file = tmp_project / "_bmad-output" / "implementation-artifacts" / "1-2-next-story.md"
-        config.max_review_rounds = 2
+        config = replace(config, max_review_rounds=2)
 
         async def mock_run_session(**kwargs):
             step_kind = kwargs.get("step_kind")
@@ -463,18 +506,12 @@ class TestCommitGapRecovery:
             commit_keys.append(kwargs.get("story_key"))
             return _make_step_result(StepKind.COMMIT, kwargs.get("story_key", ""))
 
-        # First call: recovery detection returns False (uncommitted), subsequent: True (verified)
-        commit_check_calls = {"count": 0}
-
-        async def mock_check_committed(project_dir, story_key):
-            commit_check_calls["count"] += 1
-            # First call is recovery detection — return False to trigger recovery
-            return commit_check_calls["count"] > 1
-
+        # Recovery scan finds no story commits; post-commit verification succeeds
         with patch("run_stories.orchestrator.run_claude_session", side_effect=mock_run_session), \
              patch("run_stories.orchestrator.run_commit_session", side_effect=mock_commit_session), \
              patch("run_stories.orchestrator._check_git_dirty", return_value=True, new_callable=AsyncMock), \
-             patch("run_stories.orchestrator._check_story_committed", side_effect=mock_check_committed):
+             patch("run_stories.orchestrator._committed_story_ids", return_value=set(), new_callable=AsyncMock), \
+             _PATCH_COMMIT_VERIFIED:
             count = await run_stories(config, tui)
 
         # First commit is recovery for 1-1-alpha, second is for 1-2-beta
@@ -595,8 +632,7 @@ class TestDryRunShowsResumeStep:
         assert count == 1
         mock_cs.assert_not_called()
         # Verify the TUI received the resume dry-run message
-        messages = [call.args[0].text for call in mock_tui.handle_event.call_args_list
-                    if hasattr(call.args[0], "text")]
+        messages = [call.args[0] for call in mock_tui.emit_text.call_args_list]
         assert any("code-review" in msg for msg in messages)
 
 
@@ -876,7 +912,7 @@ class TestCRSessionErrorStatusNotDone:
     async def test_warns_and_retries(self, config, tui, tmp_project):
         sprint_status = tmp_project / "_bmad-output" / "implementation-artifacts" / "sprint-status.yaml"
         story_file = tmp_project / "_bmad-output" / "implementation-artifacts" / "1-2-next-story.md"
-        config.max_review_rounds = 2
+        config = replace(config, max_review_rounds=2)
 
         cr_count = 0
 
@@ -964,7 +1000,7 @@ class TestLoadStatusSafe:
         path.write_text("development_status:\n  1-1-foo: backlog\n")
 
         call_count = 0
-        original_load = __import__("run_stories.sprint_status", fromlist=["load_status"]).load_status
+        original_load = __import__("run_stories.sprint_status", fromlist=["load_dev_status"]).load_dev_status
 
         def flaky_load(p):
             nonlocal call_count
@@ -973,7 +1009,7 @@ class TestLoadStatusSafe:
                 raise ValueError("Corrupt YAML")
             return original_load(p)
 
-        with patch("run_stories.orchestrator.load_status", side_effect=flaky_load), \
+        with patch("run_stories.orchestrator.load_dev_status", side_effect=flaky_load), \
              patch("run_stories.orchestrator._STATUS_RETRY_DELAY", 0):
             result = await _load_status_safe(path)
 
@@ -995,11 +1031,79 @@ class TestLoadStatusSafe:
         def always_fail(p):
             raise ValueError("Corrupt YAML")
 
-        with patch("run_stories.orchestrator.load_status", side_effect=always_fail), \
+        with patch("run_stories.orchestrator.load_dev_status", side_effect=always_fail), \
              patch("run_stories.orchestrator._STATUS_RETRY_DELAY", 0):
             with pytest.raises(ValueError, match="Corrupt YAML"):
                 await _load_status_safe(path)
 
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_worker_thread(self, tmp_path):
+        path = tmp_path / "status.yaml"
+        path.write_text("development_status:\n  1-1-foo: done\n")
+        first = await _load_status_safe(path)
+
+        with patch("run_stories.orchestrator.asyncio.to_thread") as mock_thread:
+            again = await _load_status_safe(path)
+        mock_thread.assert_not_called()
+        assert again["development_status"] is first["development_status"]
+
+
+class TestCommittedStoryIds:
+    """Single git-log scan used by commit-gap recovery and post-commit checks."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    async def test_extracts_ids_from_subjects(self, tmp_path):
+        env = {"GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@t", "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t"}
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        for subject in ("feat(story-1.23): thing", "feat(story-2.1): other", "chore: no story"):
+            subprocess.run(
+                ["git", "commit", "-q", "--allow-empty", "-m", subject],
+                cwd=tmp_path, check=True, env={**os.environ, **env},
+            )
+
+        ids = await _committed_story_ids(tmp_path)
+
+        assert ids == {"1.23", "2.1"}
+        assert "1.2" not in ids  # no substring false positive from story-1.23
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    async def test_extracts_ids_from_message_bodies(self, tmp_path):
+        env = {"GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@t", "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t"}
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(
+            ["git", "commit", "-q", "--allow-empty", "-m", "Add login form", "-m", "Implements story-3.4."],
+            cwd=tmp_path, check=True, env={**os.environ, **env},
+        )
+
+        assert await _committed_story_ids(tmp_path) == {"3.4"}
+
+    @pytest.mark.asyncio
+    async def test_not_a_repo_returns_empty(self, tmp_path):
+        assert await _committed_story_ids(tmp_path) == set()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    async def test_untracked_file_makes_tree_dirty(self, tmp_path, tui):
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        assert await _check_git_dirty(tmp_path, tui) is False
+        (tmp_path / "new_module.py").write_text("x = 1\n")
+        assert await _check_git_dirty(tmp_path, tui) is True
+
+    @pytest.mark.asyncio
+    async def test_first_uncommitted_skips_committed_keys(self, tmp_path, tui):
+        with patch("run_stories.orchestrator._check_git_dirty", return_value=True, new_callable=AsyncMock), \
+             patch("run_stories.orchestrator._committed_story_ids", return_value={"1.2"}, new_callable=AsyncMock):
+            dk = await _first_uncommitted_story(tmp_path, ["1-2-beta", "1-1-alpha"], tui)
+        assert dk == "1-1-alpha"
+
+    @pytest.mark.asyncio
+    async def test_first_uncommitted_none_when_clean(self, tmp_path, tui):
+        with _PATCH_GIT_CLEAN, \
+             patch("run_stories.orchestrator._committed_story_ids", return_value=set(), new_callable=AsyncMock):
+            assert await _first_uncommitted_story(tmp_path, ["1-1-alpha"], tui) is None
+
 
 # ---- Hardening measure tests ----
 
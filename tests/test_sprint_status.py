@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import os
+
 from run_stories.sprint_status import (
+    cached_dev_status,
     count_epics,
     count_stories,
     find_done_stories,
+    load_dev_status,
+    load_status,
     next_actionable_story,
+    sprint_counts,
+    story_id_from_key,
 )
 
 
@@ -100,6 +107,55 @@ class TestCountStories:
         assert done == 0
 
 
+class TestSprintCounts:
+    def test_matches_separate_counters(self):
+        assert sprint_counts(SAMPLE_STATUS) == (*count_epics(SAMPLE_STATUS), *count_stories(SAMPLE_STATUS))
+
+    def test_empty_status(self):
+        assert sprint_counts({}) == (0, 0, 0, 0)
+
+    def test_epic_with_multidigit_number(self):
+        data = {"development_status": {
+            "epic-1": "in-progress",
+            "1-1-foo": "review",
+            "epic-11": "in-progress",
+            "11-1-bar": "done",
+        }}
+        assert sprint_counts(data) == (2, 1, 2, 1)
+
+    def test_ignores_non_string_keys(self):
+        data = {"development_status": {42: "done", "1-1-foo": "done", "epic-1": "done"}}
+        assert sprint_counts(data) == (1, 1, 1, 1)
+
+    def test_rejects_malformed_keys(self):
+        data = {"development_status": {
+            "epic-1": "done",
+            "epic-1-retrospective": "done",
+            "epic-": "done",
+            "1-1-": "done",
+            "1--foo": "done",
+            "-1-foo": "done",
+            "a-1-foo": "done",
+            "1-b-foo": "done",
+            "1-1-ok": "done",
+        }}
+        assert sprint_counts(data) == (1, 1, 1, 1)
+
+
+class TestStoryIdFromKey:
+    def test_full_key(self):
+        assert story_id_from_key("1-3-stock-search") == "1.3"
+
+    def test_multidigit_parts(self):
+        assert story_id_from_key("12-10-foo") == "12.10"
+
+    def test_two_part_key(self):
+        assert story_id_from_key("2-4") == "2.4"
+
+    def test_key_without_dash_returned_unchanged(self):
+        assert story_id_from_key("standalone") == "standalone"
+
+
 class TestNextActionableStory:
 
     def test_returns_in_progress_story(self):
@@ -159,6 +215,18 @@ class TestNextActionableStory:
         }}
         assert next_actionable_story(data) == ("1-1-alpha", "backlog")
 
+    def test_skips_non_string_keys(self):
+        data = {"development_status": {42: "in-progress", "1-1-alpha": "backlog"}}
+        assert next_actionable_story(data) == ("1-1-alpha", "backlog")
+
+    def test_first_key_wins_within_same_status(self):
+        data = {"development_status": {
+            "1-1-alpha": "backlog",
+            "2-1-gamma": "review",
+            "1-2-beta": "review",
+        }}
+        assert next_actionable_story(data) == ("2-1-gamma", "review")
+
     def test_uses_sample_status(self):
         # 2-2-chat-interface is "review" which beats "backlog" stories
         assert next_actionable_story(SAMPLE_STATUS) == ("2-2-chat-interface", "review")
@@ -205,3 +273,98 @@ class TestFindDoneStories:
         assert len(result) == 4
         # Most recent first
         assert result[0] == "2-1-personality"
+
+
+class TestLoadStatus:
+    def test_loads_yaml(self, tmp_path):
+        path = tmp_path / "sprint-status.yaml"
+        path.write_text("development_status:\n  1-1-a: done\n")
+        assert load_status(path) == {"development_status": {"1-1-a": "done"}}
+
+    def test_empty_file_returns_empty_dict(self, tmp_path):
+        path = tmp_path / "sprint-status.yaml"
+        path.write_text("")
+        assert load_status(path) == {}
+
+    def test_unchanged_file_returns_cached_dict(self, tmp_path):
+        path = tmp_path / "sprint-status.yaml"
+        path.write_text("development_status:\n  1-1-a: done\n")
+        assert load_status(path) is load_status(path)
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        path = tmp_path / "sprint-status.yaml"
+        path.write_text("development_status:\n  1-1-a: backlog\n")
+        st = path.stat()
+        load_status(path)
+        path.write_text("development_status:\n  1-1-a: review\n")
+        # Same mtime as before: the size change alone must invalidate
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert load_status(path)["development_status"]["1-1-a"] == "review"
+
+
+class TestLoadDevStatus:
+    def _write(self, tmp_path, text: str):
+        path = tmp_path / "sprint-status.yaml"
+        path.write_bytes(text.encode())
+        return path
+
+    def test_cached_after_load(self, tmp_path):
+        path = tmp_path / "sprint-status.yaml"
+        path.write_text("development_status:\n  1-1-a: done\n")
+        assert cached_dev_status(path) is None
+        data = load_dev_status(path)
+        assert cached_dev_status(path) is data
+
+    def test_cached_stale_after_write(self, tmp_path):
+        path = tmp_path / "sprint-status.yaml"
+        path.write_text("development_status:\n  1-1-a: done\n")
+        load_dev_status(path)
+        path.write_text("development_status:\n  1-1-a: done\n  1-2-b: backlog\n")
+        assert cached_dev_status(path) is None
+
+    def test_section_between_other_keys(self, tmp_path):
+        path = self._write(tmp_path, (
+            "generated: 2026-02-21\n"
+            "development_status:\n"
+            "  # Epic 1\n"
+            "  epic-1: in-progress\n"
+            "\n"
+            "  1-1-a: done   # trailing comment\n"
+            "# column-0 comment inside the section\n"
+            "  1-2-b: backlog\n"
+            "story_location: docs/stories\n"
+            "notes: |\n"
+            "  not: parsed\n"
+        ))
+        assert load_dev_status(path) == {"epic-1": "in-progress", "1-1-a": "done", "1-2-b": "backlog"}
+
+    def test_matches_full_load(self, tmp_path):
+        path = self._write(tmp_path, "project: x\ndevelopment_status:\n  1-1-a: review\n")
+        assert load_dev_status(path) == load_status(path)["development_status"]
+
+    def test_flow_style_falls_back_to_full_parse(self, tmp_path):
+        path = self._write(tmp_path, "development_status: {1-1-a: done}\n")
+        assert load_dev_status(path) == {"1-1-a": "done"}
+
+    def test_alias_into_other_section_falls_back(self, tmp_path):
+        path = self._write(tmp_path, (
+            "defaults: &done done\n"
+            "development_status:\n"
+            "  1-1-a: *done\n"
+        ))
+        assert load_dev_status(path) == {"1-1-a": "done"}
+
+    def test_crlf_line_endings(self, tmp_path):
+        path = self._write(tmp_path, "project: x\r\ndevelopment_status:\r\n  1-1-a: done\r\n")
+        assert load_dev_status(path) == {"1-1-a": "done"}
+
+    def test_missing_or_empty_section(self, tmp_path):
+        assert load_dev_status(self._write(tmp_path, "project: x\n")) == {}
+        assert load_dev_status(self._write(tmp_path, "development_status:\nproject: y\n")) == {}
+
+    def test_cached_until_file_changes(self, tmp_path):
+        path = self._write(tmp_path, "development_status:\n  1-1-a: done\n")
+        first = load_dev_status(path)
+        assert load_dev_status(path) is first
+        path.write_text("development_status:\n  1-1-a: done\n  1-2-b: backlog\n")
+        assert "1-2-b" in load_dev_status(path)
@@ -19,7 +19,7 @@ from run_stories.models import (
     ToolUseEvent,
     UnknownEvent,
 )
-from run_stories.stream_parser import parse_line
+from run_stories.stream_parser import is_ignorable, parse_line
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -100,6 +100,26 @@ class TestParseToolUse:
         assert isinstance(events[0], ToolUseEvent)
         assert events[0].input_summary == "TODO|FIXME"
 
+    def test_unknown_tool_uses_first_string_value(self):
+        line = json.dumps({
+            "type": "assistant",
+            "message": {"content": [
+                {"type": "tool_use", "id": "tu_04", "name": "Task", "input": {"n": 3, "description": "explore"}},
+            ]},
+        })
+        events = parse_line(line)
+        assert events[0].input_summary == "explore"
+
+    def test_known_tool_missing_key_falls_back(self):
+        line = json.dumps({
+            "type": "assistant",
+            "message": {"content": [
+                {"type": "tool_use", "id": "tu_05", "name": "Read", "input": {"path": "/a.py"}},
+            ]},
+        })
+        events = parse_line(line)
+        assert events[0].input_summary == "/a.py"
+
 
 class TestParseToolResult:
     def test_tool_result_string_content(self):
@@ -156,6 +176,25 @@ class TestParseText:
         assert events[0].is_thinking is True
         assert events[0].text == "I need to check the imports..."
 
+    def test_thinking_dropped_when_hidden(self):
+        line = json.dumps({
+            "type": "assistant",
+            "message": {"content": [
+                {"type": "thinking", "thinking": "private"},
+                {"type": "text", "text": "visible"},
+            ]},
+        })
+        events = parse_line(line, show_thinking=False)
+        assert len(events) == 1
+        assert events[0].text == "visible"
+
+    def test_thinking_only_message_yields_nothing_when_hidden(self):
+        line = json.dumps({
+            "type": "assistant",
+            "message": {"content": [{"type": "thinking", "thinking": "private"}]},
+        })
+        assert parse_line(line, show_thinking=False) == []
+
     def test_user_text(self):
         line = json.dumps({
             "type": "user",
@@ -213,6 +252,11 @@ class TestParseResult:
         assert isinstance(events[0], ResultEvent)
         assert events[0].cost_usd is None
 
+    def test_result_integer_cost_coerced_to_float(self):
+        events = parse_line('{"type":"result","num_turns":1,"total_cost_usd":2}')
+        assert events[0].cost_usd == 2.0
+        assert type(events[0].cost_usd) is float
+
 
 class TestParseRateLimit:
     def test_rate_limited(self):
@@ -349,6 +393,30 @@ class TestMarkerDetection:
         assert len(markers) == 1
         assert markers[0].payload == "key"
 
+    def test_mixed_markers_in_text_order(self):
+        line = json.dumps({
+            "type": "assistant",
+            "message": {"content": [
+                {"type": "text", "text": "<NO_BACKLOG_STORIES /> then <HALT>blocked\non deps</HALT>"},
+            ]},
+        })
+        events = parse_line(line)
+        markers = [e for e in events if isinstance(e, MarkerEvent)]
+        assert [m.marker_type for m in markers] == [MarkerType.NO_BACKLOG_STORIES, MarkerType.HALT]
+        assert markers[1].payload == "blocked\non deps"
+
+    def test_self_closing_marker_inside_paired_payload(self):
+        line = json.dumps({
+            "type": "assistant",
+            "message": {"content": [
+                {"type": "text", "text": "<HALT>nothing to do: <NO_READY_STORIES/></HALT>"},
+            ]},
+        })
+        events = parse_line(line)
+        markers = [e for e in events if isinstance(e, MarkerEvent)]
+        assert [m.marker_type for m in markers] == [MarkerType.HALT, MarkerType.NO_READY_STORIES]
+        assert markers[0].payload == "nothing to do: <NO_READY_STORIES/>"
+
 
 # --- Error handling tests ---
 
@@ -368,12 +436,99 @@ class TestErrorHandling:
         events = parse_line("   \n  ")
         assert isinstance(events[0], UnknownEvent)
 
+    def test_blank_and_contentless_lines_share_result(self):
+        empty = parse_line("")
+        assert parse_line(b"  \n") is empty
+        line = json.dumps({"type": "assistant", "message": {"content": []}})
+        assert parse_line(line) is empty
+
     def test_unknown_type(self):
         line = json.dumps({"type": "something_new", "data": "value"})
         events = parse_line(line)
         assert isinstance(events[0], UnknownEvent)
 
 
+class TestBytesInput:
+    def test_bytes_line_parsed(self):
+        line = json.dumps({
+            "type": "assistant",
+            "message": {"content": [{"type": "text", "text": "Café ✓"}]},
+        }, ensure_ascii=False).encode("utf-8") + b"\n"
+        events = parse_line(line)
+        assert isinstance(events[0], TextEvent)
+        assert events[0].text == "Café ✓"
+
+    def test_surrounding_whitespace_tolerated(self):
+        events = parse_line(b'  {"type":"result","num_turns":2}\r\n')
+        assert isinstance(events[0], ResultEvent)
+        assert events[0].num_turns == 2
+
+    def test_empty_bytes(self):
+        events = parse_line(b"\n")
+        assert isinstance(events[0], UnknownEvent)
+        assert events[0].raw_data == ""
+
+    def test_non_object_line_kept_as_text(self):
+        events = parse_line(b"Error: something went wrong\n")
+        assert isinstance(events[0], UnknownEvent)
+        assert events[0].raw_data == "Error: something went wrong"
+
+    def test_invalid_utf8_in_result_line_still_parsed(self):
+        events = parse_line(b'{"type":"result","num_turns":3,"total_cost_usd":1.0,"result":"ok \xff"}\n')
+        assert isinstance(events[0], ResultEvent)
+        assert events[0].num_turns == 3
+        assert events[0].cost_usd == 1.0
+
+    def test_invalid_utf8_in_marker_text_still_parsed(self):
+        line = (
+            b'{"type":"assistant","message":{"content":[{"type":"text",'
+            b'"text":"tool said \xfe\xff <HALT>stuck</HALT>"}]}}'
+        )
+        events = parse_line(line)
+        assert isinstance(events[0], TextEvent)
+        assert "\ufffd" in events[0].text
+        markers = [e for e in events if isinstance(e, MarkerEvent)]
+        assert [(m.marker_type, m.payload) for m in markers] == [(MarkerType.HALT, "stuck")]
+
+    def test_malformed_bytes_decoded_for_unknown(self):
+        events = parse_line(b"{invalid \xff json")
+        assert isinstance(events[0], UnknownEvent)
+        assert isinstance(events[0].raw_data, str)
+
+
+class TestIsIgnorable:
+    def test_hook_system_line(self):
+        assert is_ignorable(b'{"type":"system","subtype":"hook_started","hook_name":"x"}\n')
+
+    def test_init_system_line_kept(self):
+        assert not is_ignorable(b'{"type":"system","subtype":"init","model":"m"}\n')
+
+    def test_tool_result_line(self):
+        line = json.dumps({
+            "type": "user",
+            "message": {"content": [{"type": "tool_result", "tool_use_id": "t", "content": "x" * 100}]},
+        }, separators=(",", ":")).encode()
+        assert is_ignorable(line)
+
+    def test_user_text_line_kept(self):
+        line = json.dumps({
+            "type": "user",
+            "message": {"content": [{"type": "text", "text": "hi"}]},
+        }, separators=(",", ":")).encode()
+        assert not is_ignorable(line)
+
+    def test_assistant_line_kept(self):
+        assert not is_ignorable(b'{"type":"assistant","message":{"content":[]}}')
+
+    def test_skipped_fixture_lines_yield_only_unused_events(self):
+        for path in FIXTURES_DIR.glob("*.log"):
+            for line in path.read_bytes().splitlines():
+                if is_ignorable(line):
+                    for event in parse_line(line):
+                        assert isinstance(event, (SystemEvent, ToolResultEvent, UnknownEvent))
+                        assert not (isinstance(event, SystemEvent) and event.subtype == "task_started")
+
+
 # --- Fixture integration tests ---
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import time
 from datetime import datetime, timezone
 from io import StringIO
+from unittest.mock import patch
 
 from rich.console import Console
 
@@ -23,7 +24,16 @@ from run_stories.models import (
     ToolUseEvent,
     UnknownEvent,
 )
-from run_stories.tui import ActivityLog, Dashboard, StoryRunnerApp, TUI, _format_duration, _format_elapsed
+from run_stories.tui import (
+    ActivityLog,
+    ActivityLogWidget,
+    Dashboard,
+    DashboardWidget,
+    StoryRunnerApp,
+    TUI,
+    _format_duration,
+    _format_elapsed,
+)
 
 
 # --- Helper ---
@@ -69,6 +79,46 @@ class TestFormatElapsed:
 
 
 class TestActivityLog:
+    def test_render_reused_until_state_changes(self):
+        log = ActivityLog()
+        log.add_event(TextEvent(text="one", is_thinking=False))
+        first = log.render(height=10)
+        assert log.render(height=10) is first
+        assert log.render(height=5) is not first
+        log.add_event(TextEvent(text="two", is_thinking=False))
+        assert "two" in render_to_text(log.render(height=10))
+
+    def test_render_cache_invalidated_by_scroll_and_toggle(self):
+        log = ActivityLog()
+        for i in range(20):
+            log.add_event(TextEvent(text=f"line {i}", is_thinking=False))
+        log.add_event(ToolUseEvent(tool_name="Read", input_summary="/x.py"))
+        frame = log.render(height=5)
+        log.scroll_up(lines=3)
+        scrolled = log.render(height=5)
+        assert scrolled is not frame
+        assert "line 16" in render_to_text(scrolled)
+        log.show_tools = True
+        assert "Read" in render_to_text(log.render(height=5))
+
+    def test_oldest_lines_dropped_past_max_lines(self):
+        log = ActivityLog(max_lines=3)
+        for i in range(5):
+            log.add_event(TextEvent(text=f"line {i}", is_thinking=False))
+        assert [text.plain for text, _ in log._lines] == ["◆ line 2", "◆ line 3", "◆ line 4"]
+        assert "line 4" in render_to_text(log.render())
+
+    def test_visible_lines_kept_in_step_with_log(self):
+        log = ActivityLog(max_lines=4)
+        for show_tools in (False, True):
+            log.show_tools = show_tools
+            for i in range(6):
+                log.add_event(ToolUseEvent(tool_name="Read", input_summary=f"/{i}.py"))
+                log.add_event(TextEvent(text=f"line {i}", is_thinking=False))
+                cached = log._visible_lines()
+                expected = [text for text, is_tool in log._lines if show_tools or not is_tool]
+                assert cached == expected
+
     def test_tool_use_event_hidden_by_default(self):
         log = ActivityLog()
         log.add_event(ToolUseEvent(tool_name="Read", input_summary="/foo/bar.py"))
@@ -76,6 +126,15 @@ class TestActivityLog:
         text = render_to_text(log.render())
         assert "Read" not in text  # but hidden in render
 
+    def test_repeated_tool_use_shares_line(self):
+        log = ActivityLog()
+        log.add_event(ToolUseEvent(tool_name="Read", input_summary="/foo/bar.py"))
+        log.add_event(ToolUseEvent(tool_name="Read", input_summary="/foo/bar.py"))
+        log.add_event(ToolUseEvent(tool_name="Read", input_summary="/foo/baz.py"))
+        (first, _), (second, _), (third, _) = log._lines
+        assert first is second
+        assert third is not first
+
     def test_tool_use_event_shown_when_enabled(self):
         log = ActivityLog()
         log.show_tools = True
@@ -194,7 +253,10 @@ class TestActivityLog:
     def test_system_event_task_started(self):
         log = ActivityLog()
         log.add_event(SystemEvent(subtype="task_started"))
-        assert len(log._lines) == 1
+        log.add_event(SystemEvent(subtype="task_started"))
+        (first, _), (second, _) = log._lines
+        assert first.plain == "⚙ task_started"
+        assert second is first
 
     def test_system_event_hook_skipped(self):
         log = ActivityLog()
@@ -406,6 +468,24 @@ class TestDashboard:
         text = render_to_text(dash.render())
         assert "No active story" in text
 
+    def test_render_reused_until_displayed_state_changes(self):
+        dash = Dashboard()
+        state = StoryState(story_key="1-3-foo", story_id="1.3")
+        dash.update_state(story_state=state, story_number=3, step_elapsed=5.2, story_elapsed=5.2, total_elapsed=5.2, total_cost=0)
+        frame = dash.render()
+        dash.step_elapsed = 5.7  # same whole second
+        assert dash.render() is frame
+        dash.step_cost = 0.12
+        assert "$0.12" in render_to_text(dash.render())
+        frame = dash.render()
+        state.current_step = StepKind.DS
+        assert dash.render() is not frame
+
+    def test_rate_limit_countdown(self):
+        dash = Dashboard()
+        dash.update_rate_limit(True, datetime.fromtimestamp(time.time() + 95, tz=timezone.utc))
+        assert "Rate limited — resets in 1m3" in render_to_text(dash.render())
+
     def test_with_story_state(self):
         dash = Dashboard()
         state = StoryState(story_key="1-3-foo", story_id="1.3")
@@ -468,6 +548,19 @@ class TestDashboard:
         text = render_to_text(dash.render())
         assert "Next story in 3s..." in text
 
+    def test_live_countdown_computed_at_render(self):
+        dash = Dashboard()
+        dash.start_countdown(5, "Next story in {}s...")
+        assert "Next story in 5s..." in render_to_text(dash.render())
+        dash._countdown_deadline -= 3
+        assert "Next story in 2s..." in render_to_text(dash.render())
+
+    def test_clear_countdown(self):
+        dash = Dashboard()
+        dash.start_countdown(5, "Next story in {}s...")
+        dash.clear_countdown()
+        assert "Next story" not in render_to_text(dash.render())
+
     def test_sprint_stats_displayed(self):
         dash = Dashboard()
         dash.update_sprint_stats(total_epics=5, done_epics=2, total_stories=30, done_stories=8)
@@ -538,6 +631,19 @@ class TestDashboard:
         assert "DS r" not in text
         assert "CR r" not in text
 
+    def test_completed_step_lines_reused_across_frames(self):
+        dash = Dashboard()
+        state = StoryState(story_key="1-2-api", story_id="1.2")
+        state.current_step = StepKind.DS
+        state.step_results = [
+            StepResult(kind=StepKind.CS, story_key="1-2-api", duration_ms=20000, num_turns=4, cost_usd=0.04, success=True),
+        ]
+        dash.update_state(story_state=state, story_number=1, step_elapsed=0, story_elapsed=0, total_elapsed=0, total_cost=0.04)
+        first = dash.render().renderables[2]
+        second = dash.render().renderables[2]
+        assert "CS" in first.plain
+        assert second is first
+
     def test_active_step_during_second_round(self):
         """Active DS in round 2 should show round label and live timer."""
         dash = Dashboard()
@@ -604,6 +710,19 @@ class TestDashboard:
         assert "✗" in text
         assert "✓ CS" in text
 
+    def test_begin_step_resets_step_fields(self):
+        dash = Dashboard()
+        state = StoryState(story_key="1-1-foo", story_id="1.1")
+        dash.update_state(story_state=state, story_number=1, step_elapsed=0, story_elapsed=0, total_elapsed=0, total_cost=0)
+        dash.step_cost = 1.25
+        before = time.monotonic()
+        dash.begin_step(StepKind.CR, story_start=before - 60, total_start=before - 600)
+        assert state.current_step == StepKind.CR
+        assert dash.step_cost is None
+        assert dash._step_start >= before
+        assert dash._story_start == before - 60
+        assert dash._total_start == before - 600
+
 
 # --- TUI integration ---
 
@@ -631,6 +750,37 @@ class TestTUI:
         tui.handle_event(TextEvent(text="hello", is_thinking=False))
         assert len(tui.activity_log._lines) == 1
 
+    def test_queue_event_deferred_until_drain(self):
+        tui = TUI()
+        tui.queue_event(TextEvent(text="queued", is_thinking=False))
+        assert len(tui.activity_log._lines) == 0
+        tui.drain_pending()
+        assert len(tui.activity_log._lines) == 1
+
+    def test_handle_event_drains_queue_first(self):
+        tui = TUI()
+        tui.queue_event(TextEvent(text="first", is_thinking=False))
+        tui.handle_event(TextEvent(text="second", is_thinking=False))
+        texts = [line.plain for line, _ in tui.activity_log._lines]
+        assert texts == ["◆ first", "◆ second"]
+
+    def test_drain_reads_clock_once_per_batch(self):
+        tui = TUI()
+        for i in range(3):
+            tui.queue_event(TextEvent(text=f"line {i}", is_thinking=False))
+        with patch("run_stories.tui.time.monotonic", return_value=100.0) as monotonic:
+            tui.drain_pending()
+        assert monotonic.call_count == 1
+        assert tui.activity_log._last_event_at == 100.0
+        assert len(tui.activity_log._lines) == 3
+
+    def test_emit_text_shows_status_line(self):
+        tui = TUI()
+        tui.queue_event(TextEvent(text="queued", is_thinking=False))
+        tui.emit_text("status")
+        texts = [line.plain for line, _ in tui.activity_log._lines]
+        assert texts == ["◆ queued", "◆ status"]
+
     def test_show_tools_default_off(self):
         tui = TUI()
         assert tui.activity_log.show_tools is False
@@ -640,6 +790,33 @@ class TestTUI:
         assert tui.activity_log.show_tools is True
 
 
+# --- Widgets ---
+
+
+class TestWidgetRefresh:
+    def test_dashboard_widget_repaints_only_on_new_frame(self):
+        dash = Dashboard()
+        widget = DashboardWidget(dash)
+        with patch.object(widget, "refresh") as refresh:
+            widget.refresh_if_changed()
+            widget.refresh_if_changed()
+            assert refresh.call_count == 1
+            dash.step_cost = 0.5
+            widget.refresh_if_changed()
+            assert refresh.call_count == 2
+
+    def test_activity_widget_repaints_only_on_new_frame(self):
+        log = ActivityLog()
+        widget = ActivityLogWidget(log)
+        with patch.object(widget, "refresh") as refresh:
+            widget.refresh_if_changed()
+            widget.refresh_if_changed()
+            assert refresh.call_count == 1
+            log.add_event(TextEvent(text="hello", is_thinking=False))
+            widget.refresh_if_changed()
+            assert refresh.call_count == 2
+
+
 # --- StoryRunnerApp finished behavior ---
 
 
@@ -691,13 +868,12 @@ class TestStoryRunnerAppFinished:
     def test_toggle_tools_action_flips_flag(self):
         app = self._make_app()
         assert app._tui.activity_log.show_tools is False
-        # Mock query_one to avoid needing mounted widgets
-        mock_widget = type("W", (), {"refresh": lambda self: None})()
-        app.query_one = lambda cls: mock_widget
-        app.action_toggle_tools()
-        assert app._tui.activity_log.show_tools is True
-        app.action_toggle_tools()
-        assert app._tui.activity_log.show_tools is False
+        with patch.object(app._activity_widget, "refresh") as refresh:
+            app.action_toggle_tools()
+            assert app._tui.activity_log.show_tools is True
+            app.action_toggle_tools()
+            assert app._tui.activity_log.show_tools is False
+        assert refresh.call_count == 2
 
 
 # --- CLI parse_args ---